@@ -1,94 +1,62 @@
 #!/usr/bin/env python3
 
-from bokeh.models import HoverTool
-from bokeh.charts import Bar
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
-from bokeh.models.ranges import FactorRange
+from bokeh.models import HoverTool, ColumnDataSource, FixedTicker
 from bokeh.io import curdoc
-from bokeh.models.widgets import Select, HBox
-from bokeh.palettes import Spectral4, brewer
-
-from functools import lru_cache
+from bokeh.palettes import Spectral4
 
 import pandas as pd
 
-# Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
+from fsaem.aggregates import year_value_counts
+from fsaem.charts import add_template_roots, styled_figure
+from fsaem.metrics import timed
 
-# Dropdown and interactive UI elements
-selectable_years = compdata.loc[compdata['Year'] >= 2013]
-selectable_years = ["All Years"] + list(map(str, selectable_years['Year'].unique()))
-select_year = Select(title="Year", value=selectable_years[0], options=selectable_years)
+# Width of each year's group of bars
+GROUP_WIDTH = 0.8
 
+@timed('get_data')
 def get_data():
-    selected_data = compdata[['Year', 'Engine Cylinders']]
-    selected_data = selected_data.rename(columns={'Engine Cylinders': 'Engine_Cylinders'})
-
-    selected_data = selected_data.apply(pd.to_numeric, errors='coerce')
-    selected_data = selected_data.dropna()
-    selected_data['Engine_Cylinders'] = selected_data['Engine_Cylinders'].astype(int)
-
-    selected_data = selected_data.sort_values(by='Engine_Cylinders', ascending=False)
-
-    selected_data['Engine_Cylinders'] = ["%d Cylinder" % cylinders for cylinders in selected_data['Engine_Cylinders']]
-   
-    # Count everything manually for compatibility with NumPy 1.7.1
-    cylinder_options = selected_data['Engine_Cylinders'].unique()
-    year_column = []
-    size_column = []
-    count_column = []
-    for year in selected_data['Year'].unique():
-        year_data = selected_data.loc[selected_data['Year'] == year]
-        for size in cylinder_options:
-            year_column.append(year)
-            size_column.append(size)
-            count_column.append(year_data['Engine_Cylinders'].loc[year_data['Engine_Cylinders'] == size].count())
+    # Year by cylinder count table, largest engines first
+    cylinder_counts = year_value_counts('Engine Cylinders')
+    cylinder_counts = cylinder_counts[sorted(cylinder_counts.columns, reverse=True)]
+    cylinder_counts = cylinder_counts.stack()
 
-    data_table = pd.DataFrame(data={'year': year_column,
-                                    'size': size_column,
-                                    'count': [float(i) for i in count_column]})
+    data_table = pd.DataFrame(data={'year': cylinder_counts.index.get_level_values(0),
+                                    'size': ["%d Cylinder" % cylinders for cylinders in cylinder_counts.index.get_level_values(1)],
+                                    'count': cylinder_counts.values.astype(float)})
 
     return data_table
 
+@timed('chart')
 def generate_chart():
     data = get_data()
-
-    # Bokeh doesn't let me control the order of the grouping! This is
-    # frustrating since it will be different on every server launch
-    barchart = Bar(data,
-                   label='year',
-                   values='count',
-                   group=cat(columns='size', ascending=True, sort=True),
-                   color=color(columns='size', palette=Spectral4),
-                   legend='top_left',
-                   xgrid=False, ygrid=False,
-                   plot_width=800, plot_height=500,
-                   tools="pan,wheel_zoom,box_zoom,reset,resize")
-
-    barchart.title = "Formula SAE Michigan Engine Cylinders"
-
-    barchart._xaxis.axis_label = "Year"
-    barchart._xaxis.axis_line_color = None
-    barchart._xaxis.major_tick_line_color = None
-    barchart._xaxis.minor_tick_line_color = None
-
-    barchart._yaxis.axis_label = "Frequency"
-    barchart._yaxis.axis_line_color = None
-    barchart._yaxis.major_tick_line_color = None
-    barchart._yaxis.minor_tick_line_color = None
-
-    barchart.outline_line_color = None
-
-    barchart.toolbar_location = 'right'
-
-    barchart.logo = None
-    
-    hover = HoverTool(tooltips=[("Engine", '@size'),
-                                ("# Teams", '@height')])
-
-    barchart.add_tools(hover)
-
-    return barchart
-
-curdoc().add_root(generate_chart())
+    years = data['year'].unique()
+    sizes = list(data['size'].unique())
+    bar_width = GROUP_WIDTH / len(sizes)
+
+    plot = styled_figure({'title': "Formula SAE Michigan Engine Cylinders",
+                          'x_label': "Year", 'y_label': "Frequency"})
+
+    # One bar per engine size side by side within each year, drawn in a
+    # fixed order so the grouping is the same on every server launch. The
+    # palette repeats when there are more sizes than colors
+    for position, size in enumerate(sizes):
+        size_color = Spectral4[position % len(Spectral4)]
+        size_data = data.loc[data['size'] == size]
+        left = size_data['year'].values - GROUP_WIDTH / 2 + position * bar_width
+        source = ColumnDataSource(data={'size': size_data['size'].tolist(),
+                                        'count': size_data['count'].tolist(),
+                                        'left_edge': left.tolist(),
+                                        'right_edge': (left + bar_width).tolist()})
+        bars = plot.quad(top='count', bottom=0, left='left_edge', right='right_edge',
+                         source=source, color=size_color, legend=size)
+        plot.add_tools(HoverTool(renderers=[bars], tooltips=[("Engine", '@size'),
+                                                             ("# Teams", '@count')]))
+
+    plot.xaxis.ticker = FixedTicker(ticks=years.astype(float))
+
+    plot.legend.location = 'top_left'
+
+    return plot
+
+# Built once per process and copied for each session
+add_template_roots(curdoc(), 'competition_cylinders', lambda: [generate_chart()])
@@ -1,89 +1,79 @@
 #!/usr/bin/env python3
 
-from bokeh.models import HoverTool, ColumnDataSource
-from bokeh.charts import Bar
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
-from bokeh.models.ranges import FactorRange
 from bokeh.io import curdoc
 from bokeh.models.widgets import Select, HBox
-from bokeh.palettes import Spectral9, brewer
 
-from functools import lru_cache
-import pandas as pd
+from fsaem import clientside
+from fsaem.cache import memoize
+from fsaem.charts import bar_data, chart
+from fsaem.clientside import view_key, view_switcher
+from fsaem.data import load_results
+from fsaem.index import rows_for
+from fsaem.metrics import timed
+from fsaem.sessions import on_session_destroyed
 
 # Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
+compdata = load_results()
+
+# Initialize the plot, a year change only replaces the source and the factors
+plot, source = chart({'kind': 'bar', 'x_label': "Country", 'y_label': "Number of Teams",
+                      'fill_color': "red",
+                      'tooltips': [("Country", '@factor'), ("# Teams", '@count')]})
 
 # Dropdown and interactive UI elements
 selectable_years = ["All Years"] + list(map(str, compdata['Year'].unique()))[::-1]
 select_year = Select(title="Year", value=selectable_years[0], options=selectable_years)
 
+@timed('callback')
 def on_year_change(attrname, old, new):
     # Set the value of the select widget forcefully to prevent race condition
     select_year.value = new
     update(new)
 
 def update(year):
-    global layout
-    layout.children[1] = generate_chart(year) 
-
-@lru_cache()
-def get_data(year):
-    selected_data = compdata
-    if year != "All Years":
-        selected_data = compdata.loc[compdata['Year'] == int(year)]
+    view = get_view(year)
+    plot.x_range.factors = view['factors']
+    source.data = view['data']
+    plot.title = view['title']
 
-    selected_data = selected_data.drop_duplicates(subset='Team')
-
-    return selected_data['Country'].value_counts() 
-
-
-def generate_chart(year):
+def get_view(year):
     data = get_data(year)
 
-    plot_data = {'country': data.index.tolist(),
-                 'count': [float(i) for i in data.values.tolist()]}
-
-    barchart = Bar(plot_data,
-                   label='country',
-                   values='count',
-                   color="red",
-                   xgrid=False, ygrid=False,
-                   plot_width=800, plot_height=500,
-                   tools="pan,wheel_zoom,box_zoom,reset,resize")
+    return {'factors': data.index.tolist(),
+            'data': bar_data(data.index.tolist(), data.values.tolist()),
+            'title': "Formula SAE Michigan " + year + " Countries"}
 
-    barchart.title = "Formula SAE Michigan " + year + " Countries"
-
-    barchart.x_range = FactorRange(factors=data.index.tolist())
-
-    barchart._xaxis.axis_label = "Country"
-    barchart._xaxis.axis_line_color = None
-    barchart._xaxis.major_tick_line_color = None
-    barchart._xaxis.minor_tick_line_color = None
-
-    barchart._yaxis.axis_label = "Number of Teams"
-    barchart._yaxis.axis_line_color = None
-    barchart._yaxis.major_tick_line_color = None
-    barchart._yaxis.minor_tick_line_color = None
-
-    barchart.outline_line_color = None
-
-    barchart.toolbar_location = 'right'
+@timed('get_data')
+@memoize()
+def get_data(year):
+    # The cache is shared by every session, so read the current results
+    # rather than the ones this session loaded
+    selected_data = load_results()
+    if year != "All Years":
+        selected_data = rows_for('Year', int(year))
 
-    barchart.logo = None
+    # Count every team once, however many spellings of its name the years use
+    selected_data = selected_data.drop_duplicates(subset='Team ID')
 
-    hover = HoverTool(tooltips=[("Country", '@x'),
-                                ("# Teams", '@height')])
+    # Country is categorical, so value_counts also lists the absent countries
+    country_counts = selected_data['Country'].value_counts()
 
-    barchart.add_tools(hover)
+    return country_counts.loc[country_counts > 0]
 
-    return barchart
 
+if clientside.enabled():
+    # Ship every year's counts with the page and switch between them in the browser
+    select_year.callback = view_switcher({view_key([year]): get_view(year) for year in selectable_years},
+                                         [select_year], source, plot, plot.x_range)
+else:
+    select_year.on_change('value', on_year_change)
 
-select_year.on_change('value', on_year_change)
+# Let go of the cached years once no session shows this dashboard
+on_session_destroyed(curdoc(), get_data.cache_release)
 
 # Bokeh plotting output
-layout = HBox(children=[select_year, generate_chart(selectable_years[0])])
+layout = HBox(children=[select_year, plot])
+
+update(selectable_years[0])
 
 curdoc().add_root(layout)
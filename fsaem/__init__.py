@@ -0,0 +1 @@
+'''Shared data access and helpers for the FSAE Michigan dashboards.'''
@@ -0,0 +1,93 @@
+'''
+Per-year aggregates shared by the dashboards.
+
+Each aggregate is built with a single groupby over the results returned by
+fsaem.data.load_results and is rebuilt only when that frame changes, so chart
+code can look values up instead of scanning the frame once per year. Every
+aggregate is per year, so newly ingested years are aggregated on their own
+and appended.
+'''
+
+import pandas as pd
+
+from fsaem.data import SCHEMA, derived
+
+NUMERIC_COLUMNS = [name for name, dtype in SCHEMA
+                   if dtype != 'category' and name != 'Year']
+
+STATISTICS = ['count', 'nulls', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def year_statistics():
+    '''
+    Summary statistics of every numeric column, per year.
+
+    The result is indexed by Year with (column, statistic) columns, so
+    ``year_statistics()['Total Score']`` is the per-year equivalent of
+    ``describe()`` plus a ``nulls`` count.
+    '''
+    def build(frame):
+        grouped = frame[['Year'] + NUMERIC_COLUMNS].groupby('Year')
+
+        count = grouped.count()
+        stats = {'count': count,
+                 'nulls': grouped.size().values[:, None] - count,
+                 'mean': grouped.mean(),
+                 'std': grouped.std(),
+                 'min': grouped.min(),
+                 '25%': grouped.quantile(0.25),
+                 '50%': grouped.quantile(0.5),
+                 '75%': grouped.quantile(0.75),
+                 'max': grouped.max()}
+
+        cube = pd.concat([stats[name] for name in STATISTICS], axis=1, keys=STATISTICS)
+        cube = cube.swaplevel(0, 1, axis=1)
+        return cube.reindex(columns=pd.MultiIndex.from_product([NUMERIC_COLUMNS, STATISTICS]))
+
+    def extend(cube, appended):
+        return pd.concat([cube, build(appended)]).sort_index()
+
+    return derived('year_statistics', build, extend)
+
+
+def year_value_counts(column):
+    '''Number of entries per (Year, value of ``column``), Year by value.'''
+    def build(frame):
+        counts = frame.groupby(['Year', column]).size()
+        return counts.unstack(fill_value=0)
+
+    def extend(counts, appended):
+        counts = pd.concat([counts, build(appended)]).sort_index()
+        return counts.fillna(0).astype(int)
+
+    return derived(('year_value_counts', column), build, extend)
+
+
+def dnf_counts(events):
+    '''
+    DNFs, entries and DNF rate of every event in ``events``, per year.
+
+    A placed team without a time in an event's column did not finish it. The
+    result is indexed by Year with (event column, 'dnfs' | 'entries' |
+    'percentage_dnf') columns, computed for all events in one groupby.
+    '''
+    events = list(events)
+
+    def build(frame):
+        placed = frame.dropna(subset=['Place'])
+        grouped = placed[events].isnull().groupby(placed['Year'])
+
+        dnfs = grouped.sum().astype(float)
+        entries = grouped.size().astype(float)
+        table = {'dnfs': dnfs,
+                 'entries': pd.DataFrame({event: entries for event in events}, columns=events),
+                 'percentage_dnf': dnfs.div(entries, axis=0)}
+
+        table = pd.concat([table[name] for name in ['dnfs', 'entries', 'percentage_dnf']],
+                          axis=1, keys=['dnfs', 'entries', 'percentage_dnf'])
+        return table.swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+    def extend(table, appended):
+        return pd.concat([table, build(appended)]).sort_index()
+
+    return derived(('dnf_counts', tuple(events)), build, extend)
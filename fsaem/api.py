@@ -0,0 +1,119 @@
+'''
+Precomputed JSON responses for the data API served by wsgi.py.
+
+Every endpoint is rendered to bytes once per loaded results frame, together
+with its ETag, so serving a request is a dict lookup. Endpoints:
+
+    /api                        index of the endpoints below
+    /api/years                  competition years
+    /api/results/<year>         every result of a year
+    /api/teams                  every team's canonical name
+    /api/teams/<team>           a team's results across the years, under
+                                any of the spellings it competed with
+    /api/stats                  per-year statistics of every numeric column
+    /api/stats/<column>         per-year statistics of a single column
+    /api/countries              number of entries per country, per year
+'''
+
+import hashlib
+import json
+from email.utils import formatdate
+
+from fsaem.aggregates import NUMERIC_COLUMNS, year_statistics, year_value_counts
+from fsaem.data import derived, last_modified_time
+from fsaem.index import group_offsets, index_keys, rows_for
+from fsaem.teams import team_names
+
+ENDPOINTS = ['/api/years',
+             '/api/results/<year>',
+             '/api/teams',
+             '/api/teams/<team>',
+             '/api/stats',
+             '/api/stats/<column>',
+             '/api/countries']
+
+
+def _to_python(frame_or_series, orient):
+    # Let pandas handle the NaN to null and numpy scalar conversions
+    return json.loads(frame_or_series.to_json(orient=orient, double_precision=15))
+
+
+def _statistics(stats):
+    # {year: {statistic: value}} for a single column of year_statistics()
+    return _to_python(stats, 'index')
+
+
+def _year_documents(rows):
+    years, year_offsets = group_offsets(rows, 'Year')
+    return {'/api/results/%d' % year: _to_python(years.iloc[start:stop], 'records')
+            for year, (start, stop) in year_offsets.items()}
+
+
+def _team_documents(team_ids):
+    names = team_names()
+    return {'/api/teams/' + names[team_id]: _to_python(rows_for('Team ID', team_id), 'records')
+            for team_id in team_ids}
+
+
+def _summary_documents():
+    stats = year_statistics()
+    documents = {'/api': {'endpoints': ENDPOINTS},
+                 '/api/years': index_keys('Year'),
+                 '/api/teams': sorted(team_names().values()),
+                 '/api/stats': {column: _statistics(stats[column]) for column in NUMERIC_COLUMNS},
+                 '/api/countries': _to_python(year_value_counts('Country'), 'index')}
+    for column in NUMERIC_COLUMNS:
+        documents['/api/stats/' + column] = documents['/api/stats'][column]
+    return documents
+
+
+def _encode(documents):
+    last_modified = formatdate(last_modified_time(), usegmt=True)
+    responses = {}
+    for path, document in documents.items():
+        body = json.dumps(document, sort_keys=True).encode('utf-8')
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        responses[path] = (etag, last_modified, body)
+    return responses
+
+
+def build_responses(frame):
+    '''Render every endpoint of the API for ``frame`` to JSON bytes.'''
+    documents = _year_documents(frame)
+    documents.update(_team_documents(team_names()))
+    documents.update(_summary_documents())
+    return _encode(documents)
+
+
+def extend_responses(responses, appended):
+    '''Re-render only the endpoints affected by newly ingested rows.'''
+    documents = _year_documents(appended)
+    documents.update(_team_documents(set(appended['Team ID'].unique()) & set(team_names())))
+    documents.update(_summary_documents())
+
+    # A team now spelled differently is served under its new name only
+    names = set('/api/teams/' + name for name in team_names().values())
+    responses = dict((path, response) for path, response in responses.items()
+                     if not path.startswith('/api/teams/') or path in names)
+    responses.update(_encode(documents))
+    return responses
+
+
+def respond(path, environ):
+    '''Return (status, headers, body) for a request of the API ``path``.'''
+    responses = derived('api_responses', build_responses, extend_responses)
+    response = responses.get(path.rstrip('/'))
+    if response is None:
+        return '404 Not Found', [('Content-Type', 'application/json')], b'{"error": "not found"}'
+
+    etag, last_modified, body = response
+    headers = [('ETag', etag),
+               ('Last-Modified', last_modified),
+               ('Cache-Control', 'public, max-age=300')]
+
+    if environ.get('HTTP_IF_NONE_MATCH') == etag or \
+            environ.get('HTTP_IF_MODIFIED_SINCE') == last_modified:
+        return '304 Not Modified', headers, b''
+
+    headers.append(('Content-Type', 'application/json'))
+    return '200 OK', headers, body
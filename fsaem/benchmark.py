@@ -0,0 +1,319 @@
+'''
+Benchmarks of loading, aggregating and rendering every dashboard.
+
+Each scale runs in a fresh process against a workbook holding ``scale``
+times as many teams per year as the real results, generated by
+fsaem.synthetic, so the first load really parses the workbook. Use
+
+    python -m fsaem.benchmark [--scales 1 10 100]
+
+to measure, for every scale,
+
+    load.cold, load.warm, load.memo    workbook parse and store write, store
+                                       read, and memoized lookup
+    aggregate.<name>                   building each shared aggregate
+    <dashboard>.session.first          the first session's script run
+    <dashboard>.session                a later session's script run
+    <dashboard>.serialize              serializing the session's document
+    <dashboard>.document_bytes         size of the serialized document
+    <dashboard>.callback.*             changing each dropdown to each value
+    <dashboard>.get_data.*             the get_data calls made meanwhile
+
+and, once against the real results, each dashboard's startup in a fresh
+interpreter:
+
+    <dashboard>.imports                importing the modules it uses, as
+                                       reported by ``python -X importtime``
+    <dashboard>.first_session          from the first import to its first
+                                       document, as fsaem.server without
+                                       preloading would take
+
+in seconds unless named otherwise, with the slowest imports of each
+dashboard listed under 'slowest_imports'. Results are written to
+benchmarks/<commit>.json; ``--compare <commit>`` reports every metric that
+got slower or bigger by more than ``--threshold`` since that commit's run.
+'''
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from fsaem.data import CACHE_DIR, REPO_DIR
+
+BENCHMARK_DIR = os.path.join(REPO_DIR, 'benchmarks')
+SCALED_DIR = os.path.join(CACHE_DIR, 'benchmarks')
+
+SCALES = [1, 10, 100]
+
+# Dropdowns with more values than this are sampled evenly
+MAX_OPTIONS = 20
+
+log = logging.getLogger(__name__)
+
+
+def scaled_workbook(scale):
+    '''Path of a workbook holding ``scale`` times the real results.'''
+    from fsaem.data import RESULTS_FILE, store_path
+    from fsaem.synthetic import generate, write_results
+
+    if scale == 1:
+        return RESULTS_FILE
+
+    path = os.path.join(SCALED_DIR, 'synthetic-%s-x%d.xlsx' % (os.path.basename(store_path(RESULTS_FILE)), scale))
+    if not os.path.isfile(path):
+        write_results(generate(scale=scale), path, store=False)
+    return path
+
+
+def _seconds(function, *args):
+    start = time.time()
+    function(*args)
+    return time.time() - start
+
+
+def _describe(prefix, values):
+    if not values:
+        return {}
+    return {prefix + '.mean': float(np.mean(values)),
+            prefix + '.p95': float(np.percentile(values, 95)),
+            prefix + '.max': float(np.max(values)),
+            prefix + '.count': len(values)}
+
+
+def _options(select, max_options):
+    options = list(select.options)
+    if len(options) <= max_options:
+        return options
+    picks = np.linspace(0, len(options) - 1, max_options).round().astype(int)
+    return [options[pick] for pick in sorted(set(picks))]
+
+
+def measure_load():
+    from fsaem import data
+
+    store_dir = data.store_path(data.RESULTS_FILE)
+    if os.path.isdir(store_dir):
+        shutil.rmtree(store_dir)
+
+    results = {'load.cold': _seconds(data.load_results)}
+    data._loaded.clear()
+    results['load.warm'] = _seconds(data.load_results)
+    results['load.memo'] = _seconds(data.load_results)
+    results['rows'] = len(data.load_results())
+    return results
+
+
+def measure_aggregates():
+    from fsaem.aggregates import year_statistics
+    from fsaem.histograms import METRICS, histograms
+    from fsaem.index import index_keys
+
+    results = {'aggregate.year_statistics': _seconds(year_statistics),
+               'aggregate.index_year': _seconds(index_keys, 'Year'),
+               'aggregate.index_team': _seconds(index_keys, 'Team ID')}
+    for metric in METRICS:
+        results['aggregate.histograms.' + metric] = _seconds(histograms, metric)
+    return results
+
+
+def measure_dashboard(name, max_options=MAX_OPTIONS):
+    from bokeh.models.widgets import Select
+    from fsaem import metrics
+    from fsaem.export import build_document
+
+    results = {name + '.session.first': _seconds(build_document, name)}
+
+    start = time.time()
+    document = build_document(name)
+    results[name + '.session'] = time.time() - start
+
+    start = time.time()
+    document_json = document.to_json_string()
+    results[name + '.serialize'] = time.time() - start
+    results[name + '.document_bytes'] = len(document_json)
+
+    # Setting a Select's value from Python runs its on_change callbacks
+    first_entry = len(metrics.read_entries())
+    callbacks = []
+    for select in document.select({'type': Select}):
+        if select.callback is not None:
+            continue
+        for option in _options(select, max_options):
+            callbacks.append(_seconds(setattr, select, 'value', option))
+    results.update(_describe(name + '.callback', callbacks))
+
+    get_data = [entry['seconds'] for entry in metrics.read_entries()[first_entry:]
+                if entry.get('dashboard') == name and entry['phase'] == 'get_data']
+    results.update(_describe(name + '.get_data', get_data))
+
+    return results
+
+
+def import_times(modules):
+    '''
+    Cumulative seconds importing each module that ``modules`` pulled in
+    directly, in a fresh interpreter, slowest first.
+    '''
+    statement = '; '.join('import %s' % module for module in modules)
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', statement],
+                               cwd=REPO_DIR, stderr=subprocess.PIPE)
+    output = process.communicate()[1].decode('utf-8', 'replace')
+
+    times = []
+    for line in output.splitlines():
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        # Nested imports are indented beneath the module importing them
+        name = parts[2].rstrip()
+        if len(name) - len(name.lstrip()) == 1:
+            times.append((name.strip(), int(parts[1]) / 1e6))
+    return sorted(times, key=lambda entry: entry[1], reverse=True)
+
+
+def measure_startup(name):
+    '''Import and first session times of a dashboard, each in a fresh interpreter.'''
+    from fsaem.server import dashboard_imports
+
+    imports = import_times(dashboard_imports(name))
+    first_session = subprocess.check_output(
+        [sys.executable, '-c',
+         'import time; start = time.time(); '
+         'from fsaem.export import build_document; build_document(%r); '
+         'print(time.time() - start)' % name], cwd=REPO_DIR)
+
+    return ({name + '.imports': sum(seconds for module, seconds in imports),
+             name + '.first_session': float(first_session.decode('ascii').split()[-1])},
+            imports[:10])
+
+
+def run_scale(dashboards, max_options=MAX_OPTIONS):
+    '''Measure everything against the workbook the process was started with.'''
+    from fsaem.data import RESULTS_FILE
+
+    os.chdir(REPO_DIR)
+    results = {'workbook_bytes': os.path.getsize(RESULTS_FILE)}
+    results.update(measure_load())
+    results.update(measure_aggregates())
+    for name in dashboards:
+        log.info("Benchmarking %s", name)
+        results.update(measure_dashboard(name, max_options))
+    return results
+
+
+def _commit():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR)
+        dirty = subprocess.call(['git', 'diff', '--quiet', 'HEAD'], cwd=REPO_DIR)
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit.decode('ascii').strip() + ('-dirty' if dirty else '')
+
+
+def run(scales, dashboards, max_options=MAX_OPTIONS):
+    '''Benchmark every scale in its own process, returning the combined results.'''
+    report = {'commit': _commit(),
+              'time': time.time(),
+              'python': platform.python_version(),
+              'platform': platform.platform(),
+              'scales': {},
+              'startup': {},
+              'slowest_imports': {}}
+
+    for name in dashboards:
+        log.info("Timing the startup of %s", name)
+        startup, slowest = measure_startup(name)
+        report['startup'].update(startup)
+        report['slowest_imports'][name] = slowest
+
+    for scale in scales:
+        workbook = scaled_workbook(scale)
+        log.info("Benchmarking %dx results from %s", scale, workbook)
+        with tempfile.NamedTemporaryFile(suffix='.jsonl') as metrics_file:
+            env = dict(os.environ, FSAEM_RESULTS_FILE=workbook,
+                       FSAEM_METRICS_FILE=metrics_file.name)
+            env.pop('FSAEM_CLIENT_SIDE', None)
+            output = subprocess.check_output(
+                [sys.executable, '-m', 'fsaem.benchmark', '--worker',
+                 '--max-options', str(max_options)] + list(dashboards),
+                cwd=REPO_DIR, env=env)
+        report['scales'][str(scale)] = json.loads(output.decode('utf-8'))
+
+    return report
+
+
+def _sections(report):
+    sections = {'%sx' % scale: results for scale, results in report['scales'].items()}
+    sections['startup'] = report.get('startup', {})
+    return sections
+
+
+def compare(report, baseline, threshold):
+    '''(section, metric, baseline, current) of every metric that regressed.'''
+    regressions = []
+    baseline_sections = _sections(baseline)
+    for section, results in sorted(_sections(report).items()):
+        for metric, value in sorted(results.items()):
+            if metric.endswith('.count'):
+                continue
+            before = baseline_sections.get(section, {}).get(metric)
+            if before and value > before * threshold:
+                regressions.append((section, metric, before, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every FSAE Michigan dashboard")
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES,
+                        help="Multiples of the real results to benchmark")
+    parser.add_argument('--max-options', type=int, default=MAX_OPTIONS,
+                        help="Most values of each dropdown to switch to")
+    parser.add_argument('--output', default=BENCHMARK_DIR,
+                        help="Directory to write <commit>.json to")
+    parser.add_argument('--compare', metavar='COMMIT',
+                        help="Report regressions against this commit's results")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown ratio counted as a regression")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('dashboards', nargs='*',
+                        help="Dashboards to benchmark, all of them by default")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+    from fsaem.server import DASHBOARDS
+    dashboards = args.dashboards or DASHBOARDS
+
+    if args.worker:
+        json.dump(run_scale(dashboards, args.max_options), sys.stdout, sort_keys=True)
+        return
+
+    report = run(args.scales, dashboards, args.max_options)
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+    path = os.path.join(args.output, report['commit'] + '.json')
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+    log.info("Wrote %s", path)
+
+    if args.compare:
+        with open(os.path.join(args.output, args.compare + '.json')) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        for section, metric, before, after in regressions:
+            print("%s %s: %.4g -> %.4g (%.2fx)" % (section, metric, before, after, after / before))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+'''
+Bounded memoization for the dashboards' get_data functions.
+
+``functools.lru_cache`` keeps every result forever, hands the same mutable
+DataFrame to every caller and never notices the workbook changing. memoize
+keeps at most ``maxsize`` results per function in LRU order, drops them all
+whenever load_results returns a new frame, and gives every caller its own
+copy of pandas results so a cached value can't be corrupted.
+
+``bokeh serve`` re-executes a dashboard script for every session, so caches
+are keyed on the function's source location rather than the function object.
+Every session of a dashboard shares one cache, so a memoized function must
+compute from load_results or the shared aggregates and indexes, never from
+the globals of the session that happens to call it. Register the wrapper's
+cache_release with fsaem.sessions.on_session_destroyed and the cache is
+emptied once the last session that defined the function is gone.
+'''
+
+import collections
+import functools
+
+from fsaem.data import load_results
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _Cache(object):
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.results = collections.OrderedDict()
+        self.frame = None
+        self.hits = 0
+        self.misses = 0
+        # Sessions that defined the memoized function and haven't released it
+        self.sessions = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.results))
+
+    def clear(self):
+        self.results.clear()
+        self.hits = self.misses = 0
+
+    def release(self):
+        '''A session is done with the cache; drop the results once none is left.'''
+        self.sessions = max(0, self.sessions - 1)
+        if not self.sessions:
+            self.results.clear()
+            self.frame = None
+
+
+# {'<file>:<function name>': _Cache}
+_caches = {}
+
+
+def _protect(value):
+    # DataFrames and Series are mutable in place, hand out a private copy
+    if hasattr(value, 'copy') and hasattr(value, 'index'):
+        return value.copy()
+    return value
+
+
+def memoize(maxsize=32):
+    def decorator(function):
+        name = '%s:%s' % (function.__code__.co_filename, function.__name__)
+        cache = _caches.setdefault(name, _Cache(maxsize))
+        cache.sessions += 1
+
+        @functools.wraps(function)
+        def wrapper(*args):
+            frame = load_results()
+            if cache.frame is not frame:
+                # The workbook changed, nothing cached is valid any more
+                cache.results.clear()
+                cache.frame = frame
+
+            if args in cache.results:
+                cache.hits += 1
+                cache.results[args] = value = cache.results.pop(args)
+                return _protect(value)
+
+            cache.misses += 1
+            value = function(*args)
+            cache.results[args] = value
+            if len(cache.results) > cache.maxsize:
+                cache.results.popitem(last=False)
+            return _protect(value)
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        # A bound method of the cache alone, so registering it doesn't keep
+        # the script's models alive
+        wrapper.cache_release = cache.release
+        return wrapper
+
+    return decorator
+
+
+def cache_stats():
+    '''{'<file>:<function name>': CacheInfo} for every memoized function.'''
+    return {name: cache.info() for name, cache in _caches.items()}
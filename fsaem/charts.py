@@ -0,0 +1,173 @@
+'''
+Styled figures built from a declarative spec, and per-process chart templates.
+
+Every dashboard used to repeat the same axis, grid, toolbar and logo styling.
+styled_figure builds a Figure from a spec dict instead:
+
+    styled_figure({'x_label': "Year", 'y_label': "Total Score",
+                   'axes': 'plain', 'title': "..."})
+
+and chart adds a ColumnDataSource-backed glyph and hover tool for the common
+chart kinds:
+
+    plot, source = chart({'kind': 'histogram', 'x_label': "Weight [kg]",
+                          'fill_color': 'OliveDrab'})
+
+Spec keys
+    kind          'histogram' (quads over hist/left_edge/right_edge/samples)
+                  or 'bar' (categorical bars over factor/count/half_count)
+    title, x_label, y_label
+    width, height defaults 800 x 500
+    tools         defaults to DEFAULT_TOOLS
+    x_range, y_range
+    axes          'minimal' hides every axis line and major tick, 'labelled_x'
+                  keeps the x axis' major ticks, 'plain' only hides minor ticks
+    grid          show grid lines, default False
+    fill_color, line_color, tooltips
+                  glyph colours and hover tooltips of a chart
+
+stacked_bars lays out the stacked event scores of team_rankings and
+team_progress.
+
+add_template_roots builds a static dashboard once per loaded results frame and
+gives each later session a copy deserialized from JSON, so no styling, data
+processing or model setup code runs per session.
+'''
+
+import numpy as np
+from bokeh.document import Document
+from bokeh.models import ColumnDataSource, HoverTool
+from bokeh.models.ranges import FactorRange
+from bokeh.plotting import Figure
+
+from fsaem.data import derived
+
+DEFAULT_TOOLS = "pan,wheel_zoom,box_zoom,reset,resize"
+
+HISTOGRAM_TOOLTIPS = [("Range", '@left_edge to @right_edge'),
+                      ("Frequency", '@hist'),
+                      ("Total # Samples", '@samples')]
+
+# Axis parts hidden by each axes style
+_HIDDEN_AXIS_PARTS = {'minimal': ['axis_line_color', 'major_tick_line_color'],
+                      'labelled_x': ['axis_line_color'],
+                      'plain': []}
+
+
+def styled_figure(spec):
+    '''Figure styled the FSAE Michigan dashboard way from a spec dict.'''
+    figure_options = {'plot_width': spec.get('width', 800),
+                      'plot_height': spec.get('height', 500),
+                      'toolbar_location': 'right',
+                      'tools': spec.get('tools', DEFAULT_TOOLS)}
+    for option in ['title', 'x_range', 'y_range']:
+        if option in spec:
+            figure_options[option] = spec[option]
+    plot = Figure(**figure_options)
+
+    axes = spec.get('axes', 'minimal')
+    plot.xaxis.axis_label = spec.get('x_label')
+    plot.xaxis.minor_tick_line_color = None
+    for part in _HIDDEN_AXIS_PARTS[axes]:
+        setattr(plot.xaxis, part, None)
+
+    plot.yaxis.axis_label = spec.get('y_label')
+    plot.yaxis.minor_tick_line_color = None
+    for part in _HIDDEN_AXIS_PARTS['minimal' if axes == 'labelled_x' else axes]:
+        setattr(plot.yaxis, part, None)
+
+    if not spec.get('grid', False):
+        plot.xgrid.grid_line_color = None
+        plot.ygrid.grid_line_color = None
+
+    plot.outline_line_color = None
+
+    plot.logo = None
+
+    return plot
+
+
+def chart(spec, data=None):
+    '''
+    Styled figure with the glyph and hover tool of ``spec['kind']``.
+
+    Returns the figure and the ColumnDataSource driving the glyph, which
+    holds ``data`` if given; callbacks update the chart by replacing
+    ``source.data``.
+    '''
+    source = ColumnDataSource(data=data or dict())
+
+    if spec['kind'] == 'histogram':
+        plot = styled_figure(dict({'axes': 'labelled_x', 'y_label': "Frequency"}, **spec))
+        glyph = plot.quad(top='hist', bottom=0, left='left_edge', right='right_edge',
+                          source=source, fill_color=spec.get('fill_color'),
+                          line_color=spec.get('line_color', '#000000'))
+        tooltips = spec.get('tooltips', HISTOGRAM_TOOLTIPS)
+
+    elif spec['kind'] == 'bar':
+        plot = styled_figure(dict({'x_range': FactorRange(factors=[])}, **spec))
+        glyph = plot.rect(x='factor', y='half_count', width=0.8, height='count',
+                          source=source, color=spec.get('fill_color'))
+        tooltips = spec.get('tooltips', [("Count", '@count')])
+
+    else:
+        raise ValueError("Unknown chart kind %r" % spec['kind'])
+
+    plot.add_tools(HoverTool(renderers=[glyph], tooltips=tooltips))
+
+    return plot, source
+
+
+def bar_data(factors, counts):
+    '''Source data of a 'bar' chart with a bar of height count per factor.'''
+    counts = [float(count) for count in counts]
+    return {'factor': list(factors),
+            'count': counts,
+            'half_count': [count / 2 for count in counts]}
+
+
+def stack_column(event, part):
+    '''Source column holding the centre ('y') or height of an event's bar segment.'''
+    return event.replace(' ', '_') + '_' + part
+
+
+def stacked_bars(frame, events):
+    '''
+    Source columns stacking each row's event scores into one bar.
+
+    Positive scores stack up from zero and negative ones, penalties, down from
+    it, each event drawn as a rect of stack_column(event, 'y') and
+    stack_column(event, 'height').
+    '''
+    stacked = {}
+    positive_total = np.zeros(len(frame))
+    negative_total = np.zeros(len(frame))
+    for event in events:
+        scores = frame[event].values
+        bottom = np.where(scores >= 0, positive_total, negative_total)
+        stacked[stack_column(event, 'y')] = (bottom + scores / 2).tolist()
+        stacked[stack_column(event, 'height')] = np.fabs(scores).tolist()
+        positive_total += np.clip(scores, 0, None)
+        negative_total += np.clip(scores, None, 0)
+    return stacked
+
+
+def add_template_roots(document, key, build):
+    '''
+    Add the roots returned by ``build()`` to ``document``.
+
+    ``build`` only runs for the first session of the process and again when
+    the results change. Its document is kept as JSON and every session gets a
+    fresh copy of the models. Only use this for dashboards without Python
+    callbacks, which are not serialized.
+    '''
+    def build_template(frame):
+        template = Document()
+        for root in build():
+            template.add_root(root)
+        return template.to_json_string()
+
+    copy = Document.from_json_string(derived(('template', key), build_template))
+    for root in list(copy.roots):
+        copy.remove_root(root)
+        document.add_root(root)
@@ -0,0 +1,55 @@
+'''
+Switch dashboard views in the browser instead of on the server.
+
+Some dashboards have so little data behind each dropdown option that every
+view can be shipped in the initial document. With FSAEM_CLIENT_SIDE=1 in the
+environment those dashboards attach a view_switcher CustomJS callback to
+their Select widgets instead of a Python on_change callback, so changing a
+dropdown costs the server nothing and the page works as static HTML.
+'''
+
+import json
+import os
+
+from bokeh.models import CustomJS
+
+
+def enabled():
+    return os.environ.get('FSAEM_CLIENT_SIDE', '') not in ('', '0')
+
+
+def view_key(values):
+    '''Key of the view shown for the given dropdown values, in Select order.'''
+    return '|'.join(values)
+
+
+def view_switcher(views, selects, source, plot, x_range=None):
+    '''
+    CustomJS callback that shows one of the precomputed ``views``.
+
+    ``views`` maps view_key(values of ``selects``) to a dict holding the
+    'data' for ``source``, the plot 'title' and, for categorical plots, the
+    'factors' of ``x_range``.
+    '''
+    args = {'source': source, 'plot': plot}
+    for index, select in enumerate(selects):
+        args['select%d' % index] = select
+    if x_range is not None:
+        args['x_range'] = x_range
+
+    code = '''
+        var views = %s;
+        var view = views[[%s].join('|')];
+        if (view === undefined) {
+            return;
+        }
+        if (view.factors !== undefined) {
+            x_range.set('factors', view.factors);
+        }
+        source.set('data', view.data);
+        source.trigger('change');
+        plot.set('title', view.title);
+    ''' % (json.dumps(views), ', '.join("select%d.get('value')" % index
+                                        for index in range(len(selects))))
+
+    return CustomJS(args=args, code=code)
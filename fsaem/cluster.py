@@ -0,0 +1,266 @@
+'''
+Serve the dashboards from several fsaem.server processes behind one port.
+
+A single Bokeh server runs every session's pandas work and callbacks on one
+interpreter. Use
+
+    python -m fsaem.cluster --port 8080 --workers 4
+
+to start one worker per core (or ``--workers`` of them) on the ports after
+--port, listening on --worker-address only, and a proxy on --port that forwards
+every request and websocket to them. A Bokeh session lives in the worker that
+rendered its page, so the proxy pins each browser to one worker with the
+WORKER_COOKIE cookie; new browsers go to the worker with the fewest open
+websockets. Workers that exit are restarted.
+
+The store is written before the workers start, so they all memory map the
+same files instead of each parsing the workbook.
+'''
+
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+
+from tornado import gen, httpclient, ioloop, web, websocket
+
+from fsaem.data import REPO_DIR, load_results
+
+WORKER_COOKIE = 'fsaem-worker'
+
+# Hop-by-hop headers, and the length tornado recomputes for the proxied body
+_SKIPPED_HEADERS = set(['Connection', 'Keep-Alive', 'Transfer-Encoding', 'Upgrade',
+                        'Content-Length', 'Proxy-Authenticate', 'Proxy-Authorization',
+                        'Te', 'Trailer'])
+
+# How often to look for workers that exited, in milliseconds
+CHECK_WORKERS_INTERVAL = 5000
+
+log = logging.getLogger(__name__)
+
+
+def default_workers():
+    '''Number of cores this process may run on.'''
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+
+class Worker(object):
+    '''An fsaem.server process listening on address:port.'''
+
+    def __init__(self, number, address, port, arguments):
+        self.number = number
+        self.address = address
+        self.port = port
+        self.arguments = arguments
+        self.connections = 0
+        self.process = None
+
+    def start(self):
+        command = [sys.executable, '-m', 'fsaem.server',
+                   '--address', self.address, '--port', str(self.port)] + self.arguments
+        self.process = subprocess.Popen(command, cwd=REPO_DIR)
+        log.info("Started worker %d on port %d", self.number, self.port)
+
+    def restart_if_exited(self):
+        if self.process.poll() is not None:
+            log.warning("Worker %d exited with %d, restarting", self.number, self.process.returncode)
+            self.connections = 0
+            self.start()
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+
+    def url(self, uri, scheme='http'):
+        return '%s://%s:%d%s' % (scheme, self.address, self.port, uri)
+
+
+class Balancer(object):
+    '''Picks the worker serving each request.'''
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._next = 0
+
+    def pick(self, handler):
+        '''The worker pinned by the request's cookie, else the least busy one.'''
+        pinned = handler.get_cookie(WORKER_COOKIE)
+        if pinned is not None and pinned.isdigit() and int(pinned) < len(self.workers):
+            return self.workers[int(pinned)]
+
+        # Rotate the starting point so idle workers share new browsers
+        order = self.workers[self._next:] + self.workers[:self._next]
+        self._next = (self._next + 1) % len(self.workers)
+        return min(order, key=lambda worker: worker.connections)
+
+
+class ProxyHandler(web.RequestHandler):
+    SUPPORTED_METHODS = ('GET', 'HEAD', 'POST')
+
+    def initialize(self, balancer):
+        self.balancer = balancer
+
+    @gen.coroutine
+    def get(self, *args):
+        worker = self.balancer.pick(self)
+        request = httpclient.HTTPRequest(worker.url(self.request.uri),
+                                         method=self.request.method,
+                                         headers=self.request.headers,
+                                         body=self.request.body if self.request.method == 'POST' else None,
+                                         follow_redirects=False,
+                                         decompress_response=False)
+        try:
+            response = yield httpclient.AsyncHTTPClient().fetch(request)
+        except httpclient.HTTPError as error:
+            response = error.response
+        except (IOError, OSError):
+            response = None
+
+        if response is None:
+            # The worker is down or still starting
+            self.send_error(502)
+            return
+
+        self.set_status(response.code, response.reason)
+        for name in ('Content-Type', 'Date', 'Server'):
+            self.clear_header(name)
+        for name, value in response.headers.get_all():
+            if name not in _SKIPPED_HEADERS:
+                self.add_header(name, value)
+        self.set_cookie(WORKER_COOKIE, str(worker.number))
+        if response.body:
+            self.write(response.body)
+
+    head = get
+    post = get
+
+
+class WebSocketProxy(websocket.WebSocketHandler):
+    '''Relays a session's websocket to the worker its page came from.'''
+
+    def initialize(self, balancer):
+        self.balancer = balancer
+        self.upstream = None
+        self.pending = []
+        self.worker = None
+
+    def check_origin(self, origin):
+        # The worker checks the forwarded Origin against its --host whitelist
+        return True
+
+    def open(self, *args):
+        self.worker = self.balancer.pick(self)
+        self.worker.connections += 1
+        ioloop.IOLoop.current().spawn_callback(self._relay)
+
+    @gen.coroutine
+    def _relay(self):
+        headers = dict((name, value) for name, value in self.request.headers.get_all()
+                       if name in ('Host', 'Origin', 'Cookie', 'User-Agent'))
+        request = httpclient.HTTPRequest(self.worker.url(self.request.uri, 'ws'), headers=headers)
+        try:
+            self.upstream = yield websocket.websocket_connect(request)
+        except (httpclient.HTTPError, IOError, OSError):
+            self.close()
+            return
+
+        if self.ws_connection is None:
+            # The browser left while the worker was connecting
+            self.upstream.close()
+            return
+
+        # Messages the browser sent while connecting
+        for message in self.pending:
+            self.upstream.write_message(message, binary=not isinstance(message, str))
+        self.pending = None
+
+        while True:
+            message = yield self.upstream.read_message()
+            if message is None:
+                self.close()
+                return
+            try:
+                self.write_message(message, binary=not isinstance(message, str))
+            except websocket.WebSocketClosedError:
+                return
+
+    def on_message(self, message):
+        if self.upstream is None:
+            self.pending.append(message)
+        else:
+            self.upstream.write_message(message, binary=not isinstance(message, str))
+
+    def on_close(self):
+        self.worker.connections = max(0, self.worker.connections - 1)
+        if self.upstream is not None:
+            self.upstream.close()
+
+
+def make_proxy(balancer):
+    # Bokeh sessions talk over /<dashboard>/ws, everything else is plain HTTP
+    return web.Application([(r'/[^/]+/ws', WebSocketProxy, {'balancer': balancer}),
+                            (r'/.*', ProxyHandler, {'balancer': balancer})])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve every FSAE Michigan dashboard from several processes")
+    parser.add_argument('--address', default=None,
+                        help="Address the proxy listens on")
+    parser.add_argument('--port', type=int, default=5006,
+                        help="Port the proxy listens on")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Worker processes, one per core when 0")
+    parser.add_argument('--worker-address', default='127.0.0.1',
+                        help="Address the workers listen on")
+    parser.add_argument('--worker-port', type=int, default=None,
+                        help="Port of the first worker, the ones after --port by default")
+    parser.add_argument('--host', action='append', default=[],
+                        help="Public hostname[:port] allowed to connect; may be repeated")
+    parser.add_argument('--log-level', default='info',
+                        choices=['debug', 'info', 'warning', 'error', 'critical'])
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+
+    # Build the store once so every worker maps it instead of parsing the workbook
+    os.chdir(REPO_DIR)
+    load_results()
+
+    # Requests reach the workers with the browser's Host header
+    hosts = args.host or ['localhost:%d' % args.port]
+    worker_arguments = ['--log-level', args.log_level]
+    for host in hosts:
+        worker_arguments += ['--host', host]
+
+    count = args.workers or default_workers()
+    first_port = args.worker_port or args.port + 1
+    workers = [Worker(number, args.worker_address, first_port + number, worker_arguments)
+               for number in range(count)]
+    for worker in workers:
+        worker.start()
+
+    proxy = make_proxy(Balancer(workers))
+    proxy.listen(args.port, address=args.address or '')
+    log.info("Proxying port %d to %d workers on ports %d-%d",
+             args.port, count, first_port, first_port + count - 1)
+
+    loop = ioloop.IOLoop.current()
+    signal.signal(signal.SIGTERM, lambda signum, frame: loop.add_callback_from_signal(loop.stop))
+    ioloop.PeriodicCallback(lambda: [worker.restart_if_exited() for worker in workers],
+                            CHECK_WORKERS_INTERVAL).start()
+    try:
+        loop.start()
+    finally:
+        for worker in workers:
+            worker.stop()
+
+
+if __name__ == '__main__':
+    main()
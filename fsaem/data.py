@@ -0,0 +1,301 @@
+'''
+Shared access to the FSAE Michigan results workbook.
+
+Parsing FSAEM_summarized_results.xlsx takes hundreds of milliseconds, and
+``bokeh serve`` re-executes every dashboard script for each new session. The
+workbook is therefore streamed once by fsaem.xlsx into the dtypes in SCHEMA,
+written to a columnar cache of ``.npy`` files keyed on the workbook contents,
+and memoized for the lifetime of the process. Use
+
+    from fsaem.data import load_results
+    compdata = load_results()
+
+and treat the returned frame as read-only; take a ``.copy()`` before mutating.
+Its columns are read-only arrays, so writing to them in place raises.
+Besides the workbook's columns the frame has an integer 'Team ID', the same
+for every spelling of a team's name; see fsaem.teams.
+'''
+
+import collections
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# FSAEM_RESULTS_FILE points every dashboard at another workbook, e.g. the
+# scaled up copies used by fsaem.benchmark
+RESULTS_FILE = os.environ.get('FSAEM_RESULTS_FILE',
+                              os.path.join(REPO_DIR, 'FSAEM_summarized_results.xlsx'))
+CACHE_DIR = os.path.join(REPO_DIR, '.cache')
+
+# Bump whenever the on-disk layout of the store or SCHEMA changes
+STORE_VERSION = 3
+
+# Every column of the workbook and the dtype it is normalized to at load.
+# Numeric columns hold free text such as 'DNF', 'withdrawn' or a non-breaking
+# space in the workbook; those cells become NaN.
+SCHEMA = [('Place', 'float64'),
+          ('Year', 'int64'),
+          ('Car Num', 'float64'),
+          ('Team', 'category'),
+          ('Penalty', 'float64'),
+          ('Cost Score', 'float64'),
+          ('Presentation Score', 'float64'),
+          ('Design Score', 'float64'),
+          ('Acceleration Score', 'float64'),
+          ('Skid Pad Score', 'float64'),
+          ('Autocross Score', 'float64'),
+          ('Endurance Score', 'float64'),
+          ('Efficiency Score', 'float64'),
+          ('Total Score', 'float64'),
+          ('Country', 'category'),
+          ('Engine Cylinders', 'float64'),
+          ('Engine Displacement (cc)', 'float64'),
+          ('Weight (kg)', 'float64'),
+          ('Weight (lbs)', 'float64'),
+          ('Endurance Time', 'float64'),
+          ('Endurance Cones', 'float64'),
+          ('Endurance Off Course', 'float64'),
+          ('Endurance Adjusted Time', 'float64'),
+          ('AutoX Best Time', 'float64'),
+          ('Skid Pad Best Time', 'float64'),
+          ('Accel Best Time', 'float64')]
+
+COLUMNS = [name for name, dtype in SCHEMA]
+
+# Years appended by ``python -m fsaem.ingest`` live beside the workbook's store,
+# one store per year under INGEST_DIR/<workbook name>/<year>
+INGEST_DIR = os.path.join(CACHE_DIR, 'ingested')
+
+_Load = collections.namedtuple('_Load', ['stat_key', 'base', 'partitions', 'frame'])
+
+# Process-wide memo of {workbook path: _Load}
+_loaded = {}
+
+# The most recent load that only appended ingested rows to the previous frame,
+# as (previous frame, new frame, appended rows)
+_last_append = (None, None, None)
+
+# {key: (frame the value was derived from, value)}
+_derived = {}
+
+
+def load_results(path=RESULTS_FILE):
+    global _last_append
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stat_key = (stat.st_mtime, stat.st_size)
+    partitions = ingested_partitions(path)
+
+    cached = _loaded.get(path)
+    if cached is not None and cached.stat_key == stat_key:
+        if cached.partitions == partitions:
+            return cached.frame
+
+        if partitions[:len(cached.partitions)] == cached.partitions:
+            # Only new years were ingested, append them to what is loaded
+            appended = _read_partitions(path, partitions[len(cached.partitions):],
+                                        cached.base, cached.frame)
+            frame = read_only(concat_results([cached.frame, appended]))
+            _last_append = (cached.frame, frame, frame.iloc[len(cached.frame):])
+            _loaded[path] = _Load(stat_key, cached.base, partitions, frame)
+            return frame
+
+    from fsaem.metrics import timer
+    with timer('load', source='store') as fields:
+        store_dir = store_path(path)
+        try:
+            base = read_store(store_dir)
+        except (IOError, OSError, ValueError, KeyError):
+            from fsaem.teams import add_team_ids
+            from fsaem.xlsx import read_columns
+            fields['source'] = 'workbook'
+            base = pd.DataFrame(read_columns(path, COLUMNS), columns=COLUMNS)
+            write_store(add_team_ids(base)[0], store_dir)
+            # Serve the store's mapped columns like every later load does
+            base = read_store(store_dir)
+
+        frame = base
+        if partitions:
+            frame = read_only(concat_results([base, _read_partitions(path, partitions, base, base)]))
+        fields['rows'] = len(frame)
+
+    _loaded[path] = _Load(stat_key, base, partitions, frame)
+    return frame
+
+
+def ingest_dir(path=RESULTS_FILE):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(INGEST_DIR, name)
+
+
+def ingested_partitions(path=RESULTS_FILE):
+    '''Names of the year stores ingested for a workbook, in ingest order.'''
+    directory = ingest_dir(path)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory)
+                  if os.path.isfile(os.path.join(directory, name, 'manifest.json')))
+
+
+def last_modified_time(path=RESULTS_FILE):
+    '''Time the workbook or any year ingested for it last changed.'''
+    times = [os.stat(path).st_mtime]
+    for name in ingested_partitions(path):
+        times.append(os.stat(os.path.join(ingest_dir(path), name, 'manifest.json')).st_mtime)
+    return max(times)
+
+
+def _read_partitions(path, partitions, base, loaded):
+    # A year ingested separately and later added to the workbook itself is
+    # superseded by the workbook
+    base_years = set(base['Year'].unique())
+    frames = []
+    for name in partitions:
+        frame = read_store(os.path.join(ingest_dir(path), name))
+        if base_years.intersection(frame['Year'].unique()):
+            continue
+        # The base store numbers its teams afresh whenever the workbook
+        # changes, so the IDs a year was ingested with may now belong to other
+        # teams. Match its teams against what is loaded, as ingest did.
+        from fsaem.teams import add_team_ids
+        frame = add_team_ids(frame, concat_results([loaded] + frames), fuzzy=True)[0]
+        frames.append(frame)
+    return concat_results(frames) if frames else base.iloc[:0]
+
+
+def concat_results(frames, ignore_index=True):
+    '''Concatenate result frames, merging the categories of categorical columns.'''
+    frames = [frame.copy() for frame in frames]
+    for name, dtype in SCHEMA:
+        if dtype != 'category' or name not in frames[0]:
+            continue
+        categories = sorted(set().union(*[frame[name].cat.categories for frame in frames]))
+        for frame in frames:
+            frame[name] = frame[name].cat.set_categories(categories)
+
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+def read_only(frame):
+    '''A frame over read-only copies of ``frame``'s columns.'''
+    columns = {}
+    for name in frame.columns:
+        column = frame[name]
+        if str(column.dtype) == 'category':
+            codes = np.array(column.cat.codes)
+            codes.flags.writeable = False
+            columns[name] = pd.Categorical.from_codes(codes, dtype=column.dtype)
+        else:
+            values = np.array(column)
+            values.flags.writeable = False
+            columns[name] = values
+
+    # copy=False keeps pandas from copying the arrays into writable blocks
+    return pd.DataFrame(columns, columns=frame.columns, index=frame.index, copy=False)
+
+
+def derived(key, build, extend=None):
+    '''
+    Memoize ``build(frame)`` against the frame returned by load_results.
+
+    The value is rebuilt only when the workbook changes, so aggregates and
+    indexes derived from the results are computed once per loaded frame. When
+    the frame only gained ingested rows, ``extend(value, appended rows)`` is
+    tried first; it returns the updated value, or None to rebuild instead.
+    '''
+    frame = load_results()
+    cached = _derived.get(key)
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+
+    value = None
+    previous, current, appended = _last_append
+    if extend is not None and cached is not None and cached[0] is previous and frame is current:
+        value = extend(cached[1], appended)
+    if value is None:
+        value = build(frame)
+
+    _derived[key] = (frame, value)
+    return value
+
+
+def store_path(path=RESULTS_FILE):
+    '''Directory of the store caching a workbook, keyed on its contents.'''
+    return os.path.join(CACHE_DIR, _workbook_digest(path))
+
+
+def _workbook_digest(path):
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as workbook:
+        for chunk in iter(lambda: workbook.read(1 << 16), b''):
+            sha1.update(chunk)
+    return 'v%d-%s' % (STORE_VERSION, sha1.hexdigest())
+
+
+def normalize(frame):
+    '''Coerce a raw workbook frame to the dtypes in SCHEMA.'''
+    columns = {}
+    for name, dtype in SCHEMA:
+        if dtype == 'category':
+            columns[name] = frame[name].astype('category')
+        else:
+            columns[name] = pd.to_numeric(frame[name], errors='coerce').astype(dtype)
+
+    return pd.DataFrame(columns, columns=COLUMNS)
+
+
+def write_store(frame, store_dir):
+    '''Write every column of a normalized frame as its own ``.npy`` file.'''
+    parent = os.path.dirname(store_dir)
+    if not os.path.isdir(parent):
+        os.makedirs(parent)
+
+    # Build the store beside its final location and rename it into place so
+    # that concurrent readers never see a half written store
+    staging_dir = tempfile.mkdtemp(dir=parent)
+    manifest = []
+    for index, column in enumerate(frame.columns):
+        entry = {'name': column, 'kind': 'native'}
+        if str(frame[column].dtype) == 'category':
+            entry['kind'] = 'category'
+            categories = np.asarray(frame[column].cat.categories, dtype=str)
+            np.save(os.path.join(staging_dir, '%d.categories.npy' % index), categories)
+            values = np.asarray(frame[column].cat.codes)
+        else:
+            values = np.asarray(frame[column])
+        np.save(os.path.join(staging_dir, '%d.npy' % index), values)
+        manifest.append(entry)
+
+    with open(os.path.join(staging_dir, 'manifest.json'), 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    try:
+        os.rename(staging_dir, store_dir)
+    except OSError:
+        # Another process beat us to it
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def read_store(store_dir):
+    '''Load a store written by write_store, memory mapping each column.'''
+    with open(os.path.join(store_dir, 'manifest.json')) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    columns = {}
+    for index, entry in enumerate(manifest):
+        values = np.load(os.path.join(store_dir, '%d.npy' % index), mmap_mode='r')
+        if entry['kind'] == 'category':
+            categories = np.load(os.path.join(store_dir, '%d.categories.npy' % index))
+            values = pd.Categorical.from_codes(values, categories=categories)
+        columns[entry['name']] = values
+
+    # Without copy=False pandas copies the columns into blocks of its own and
+    # the frame no longer reads from the mapped, read-only files
+    return pd.DataFrame(columns, columns=[entry['name'] for entry in manifest], copy=False)
@@ -0,0 +1,144 @@
+'''
+Pre-render every dashboard to static HTML and JSON.
+
+The results only change between deployments, so every dashboard, and every
+combination of its dropdown values, can be rendered ahead of time and served
+as plain files by wsgi.py. Use
+
+    python -m fsaem.export [--output static]
+
+to write static/<dashboard>/index.html for the initial view,
+static/<dashboard>/<view>.html for every dropdown combination, a matching
+.json document next to each page and static/manifest.json listing them all.
+Changing a dropdown on an exported page opens the page of the new values.
+Dashboards supporting fsaem.clientside are exported in that mode, as a single
+page holding every view.
+'''
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import re
+
+from bokeh.application.handlers import ScriptHandler
+from bokeh.document import Document
+from bokeh.embed import file_html
+from bokeh.models import CustomJS
+from bokeh.models.widgets import Select
+from bokeh.resources import CDN
+
+from fsaem.clientside import view_key
+from fsaem.data import REPO_DIR
+from fsaem.server import DASHBOARDS, load_shared_data
+
+STATIC_DIR = os.path.join(REPO_DIR, 'static')
+
+log = logging.getLogger(__name__)
+
+
+def view_name(values):
+    '''File name stem of the view showing the given dropdown values.'''
+    return re.sub(r'[^a-z0-9]+', '-', '-'.join(values).lower()).strip('-')
+
+
+def build_document(name):
+    '''Run a dashboard script against a fresh Document, as a server session would.'''
+    handler = ScriptHandler(filename=os.path.join(REPO_DIR, name + '.py'))
+    document = Document()
+    handler.modify_document(document)
+    if handler.failed:
+        raise RuntimeError("%s failed: %s" % (name, handler.error))
+    return document
+
+
+def page_switcher(selects, pages):
+    '''
+    CustomJS callback opening the exported page of the selected values.
+
+    ``pages`` maps view_key(values of ``selects``) to the page's file name.
+    '''
+    args = dict(('select%d' % index, select) for index, select in enumerate(selects))
+    code = '''
+        var pages = %s;
+        var page = pages[[%s].join('|')];
+        if (page !== undefined) {
+            window.location.href = page;
+        }
+    ''' % (json.dumps(pages), ', '.join("select%d.get('value')" % index
+                                        for index in range(len(selects))))
+
+    return CustomJS(args=args, code=code)
+
+
+def write_view(document, title, output_dir, stem):
+    with open(os.path.join(output_dir, stem + '.html'), 'w') as page:
+        page.write(file_html(document.roots, CDN, title))
+    with open(os.path.join(output_dir, stem + '.json'), 'w') as items:
+        items.write(document.to_json_string())
+    return stem + '.html'
+
+
+def export_dashboard(name, output_dir):
+    '''Render the initial view and every dropdown combination of a dashboard.'''
+    dashboard_dir = os.path.join(output_dir, name)
+    if not os.path.isdir(dashboard_dir):
+        os.makedirs(dashboard_dir)
+
+    document = build_document(name)
+
+    # Selects with a CustomJS callback already switch views inside the page
+    selects = [select for select in document.select({'type': Select}) if select.callback is None]
+    selects.sort(key=lambda select: select.title)
+    combinations = list(itertools.product(*[select.options for select in selects]))
+
+    # There is no server to run the dashboard's Python callbacks, so a
+    # dropdown change opens the page already rendered for the new values
+    if selects:
+        switcher = page_switcher(selects, {view_key(values): view_name(values) + '.html'
+                                           for values in combinations})
+        for select in selects:
+            select.callback = switcher
+
+    entry = {'index': name + '/' + write_view(document, name, dashboard_dir, 'index'),
+             'selects': [select.title for select in selects],
+             'views': {}}
+
+    # Setting a Select's value from Python runs the same on_change callbacks
+    # a browser session would, so each combination renders its real chart
+    for values in combinations:
+        for select, value in zip(selects, values):
+            select.value = value
+        stem = view_name(values)
+        entry['views'][stem] = {'values': dict(zip(entry['selects'], values)),
+                                'page': name + '/' + write_view(document, name, dashboard_dir, stem)}
+
+    log.info("Exported %s with %d views", name, len(entry['views']))
+    return entry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render every FSAE Michigan dashboard")
+    parser.add_argument('--output', default=STATIC_DIR,
+                        help="Directory to write the pages to")
+    parser.add_argument('dashboards', nargs='*', default=DASHBOARDS,
+                        help="Dashboards to export, all of them by default")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    os.chdir(REPO_DIR)
+    load_shared_data()
+
+    # Static pages have no server to run callbacks, so let the dashboards
+    # that can switch views in the browser do so
+    os.environ['FSAEM_CLIENT_SIDE'] = '1'
+
+    manifest = {name: export_dashboard(name, args.output) for name in args.dashboards}
+    with open(os.path.join(args.output, 'manifest.json'), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
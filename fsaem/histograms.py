@@ -0,0 +1,121 @@
+'''
+Precomputed Freedman–Diaconis histograms of every metric, for every year.
+
+The bins of a metric are chosen once from all years of results, so the
+histograms of different years share their edges and can be compared. The
+counts of every year are then found in one pass with np.bincount. Use
+
+    histogram('Weight (kg)', 2015)
+
+to get the ColumnDataSource data of a year, or of 'All Years'. A new metric
+only needs an entry in METRICS.
+'''
+
+import math
+
+import numpy as np
+
+from fsaem.data import derived
+
+ALL_YEARS = "All Years"
+
+# Options of every metric:
+#   max_value    the metric is a score out of max_value points. Bins are a
+#                whole divisor of it and run from the rounded minimum up to it.
+#   require      only count results that also have a value in this column,
+#                e.g. the time behind a dynamic event score
+#   exclude_zero leave out zeros, which stand in for unreported values
+METRICS = {'Total Score': {'max_value': 1000},
+           'Presentation Score': {'max_value': 75},
+           'Design Score': {'max_value': 150},
+           'Cost Score': {'max_value': 100},
+           'Acceleration Score': {'max_value': 75, 'require': 'Accel Best Time'},
+           'Skid Pad Score': {'max_value': 50, 'require': 'Skid Pad Best Time'},
+           'Autocross Score': {'max_value': 150, 'require': 'AutoX Best Time'},
+           'Efficiency Score': {'max_value': 100, 'require': 'Endurance Adjusted Time'},
+           'Endurance Score': {'max_value': 300, 'require': 'Endurance Adjusted Time'},
+           'Weight (kg)': {'exclude_zero': True},
+           'Engine Displacement (cc)': {'exclude_zero': True},
+           'Endurance Adjusted Time': {},
+           'AutoX Best Time': {},
+           'Skid Pad Best Time': {},
+           'Accel Best Time': {}}
+
+
+def fd_binsize(values):
+    '''Freedman–Diaconis bin width of ``values``.'''
+    first_quartile, third_quartile = np.percentile(values, [25, 75])
+    return 2 * math.fabs(third_quartile - first_quartile) * math.pow(len(values), -1/3)
+
+
+def bin_edges(values, max_value=None):
+    '''Bin edges for ``values`` following the Freedman–Diaconis rule.'''
+    fdrule_binsize = fd_binsize(values)
+
+    if max_value is None:
+        bins = 1
+        if fdrule_binsize > 0:
+            bins = max(1, int(round((values.max() - values.min()) / fdrule_binsize)))
+        return np.linspace(values.min(), values.max(), bins + 1)
+
+    # Snap to a bin size that evenly divides the points available and round
+    # the minimum score to a whole number of bins
+    acceptable_binsizes = [binsize for binsize in range(1, max_value)
+                           if max_value % binsize == 0]
+    binsize = min(acceptable_binsizes, key=lambda x: abs(x - fdrule_binsize))
+    min_value = int(binsize * round(float(values.min()) / binsize))
+    bins = int(round((max_value - min_value) / binsize))
+    return np.linspace(min_value, max_value, bins + 1)
+
+
+def _source_data(counts, edges):
+    return {'hist': counts.tolist(),
+            'left_edge': edges[:-1].tolist(),
+            'right_edge': edges[1:].tolist(),
+            'samples': [int(counts.sum())] * len(counts)}
+
+
+def _build(frame, metric, options):
+    columns = [metric] + ([options['require']] if 'require' in options else [])
+    selected = frame[['Year'] + columns].dropna()
+    if options.get('exclude_zero'):
+        selected = selected.loc[selected[metric] != 0]
+
+    values = selected[metric].values
+    if len(values) == 0:
+        return {}
+    edges = bin_edges(values, options.get('max_value'))
+    bins = len(edges) - 1
+
+    # Bin every value once; like np.histogram, values outside the edges are
+    # dropped and the last bin includes its right edge
+    bin_index = np.searchsorted(edges, values, side='right') - 1
+    bin_index[values == edges[-1]] = bins - 1
+    in_range = (bin_index >= 0) & (bin_index < bins)
+
+    years, year_index = np.unique(selected['Year'].values, return_inverse=True)
+    counts = np.bincount(year_index[in_range] * bins + bin_index[in_range],
+                         minlength=len(years) * bins).reshape(len(years), bins)
+
+    histograms = {ALL_YEARS: _source_data(counts.sum(axis=0), edges)}
+    for year, year_counts in zip(years.tolist(), counts):
+        histograms[year] = _source_data(year_counts, edges)
+    return histograms
+
+
+def histograms(metric):
+    '''{year or ALL_YEARS: ColumnDataSource data} for every year of ``metric``.'''
+    options = METRICS[metric]
+    return derived(('histograms', metric), lambda frame: _build(frame, metric, options))
+
+
+def histogram(metric, year=ALL_YEARS):
+    '''
+    Histogram of ``metric`` for ``year``, as data for a ColumnDataSource.
+
+    The data has 'hist', 'left_edge', 'right_edge' and 'samples' columns.
+    Years without results have an empty histogram.
+    '''
+    if year != ALL_YEARS:
+        year = int(year)
+    return histograms(metric).get(year, _source_data(np.zeros(0, dtype=int), np.zeros(1)))
@@ -0,0 +1,68 @@
+'''
+Row offset indexes over the results.
+
+Filtering with ``compdata.loc[compdata['Year'] == year]`` scans the whole
+frame on every dropdown change. Instead the frame is sorted once by the key
+column and the (start, stop) offsets of every key are recorded, so rows for a
+year or team come back as a contiguous ``iloc`` slice.
+'''
+
+import numpy as np
+
+from fsaem.data import concat_results, derived
+
+
+def group_offsets(frame, column):
+    '''
+    Sort ``frame`` by ``column`` and find where each value's rows start and stop.
+
+    Returns the sorted frame and a dict of {value: (start, stop)}. The sort is
+    stable, so rows keep their workbook order within each value.
+    '''
+    ordered = frame.sort_values(by=column, kind='mergesort')
+    ordered = ordered.loc[ordered[column].notnull()]
+
+    keys = ordered[column]
+    if str(keys.dtype) == 'category':
+        codes = np.asarray(keys.cat.codes)
+    else:
+        codes = np.asarray(keys)
+
+    boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(codes)]))
+    labels = np.asarray(keys)[starts].tolist() if len(codes) else []
+
+    offsets = {label: (int(start), int(stop))
+               for label, start, stop in zip(labels, starts, stops)}
+    return ordered, offsets
+
+
+def _results_index(column):
+    def extend(index, appended):
+        ordered, offsets = index
+        appended, appended_offsets = group_offsets(appended, column)
+        if set(offsets).intersection(appended_offsets):
+            # Rows were added to existing keys, the whole index has to be re-sorted
+            return None
+
+        offsets = dict(offsets)
+        for key, (start, stop) in appended_offsets.items():
+            offsets[key] = (start + len(ordered), stop + len(ordered))
+        return concat_results([ordered, appended], ignore_index=False), offsets
+
+    return derived(('group_offsets', column),
+                   lambda frame: group_offsets(frame, column), extend)
+
+
+def rows_for(column, value):
+    '''All results whose ``column`` equals ``value``, e.g. rows_for('Year', 2015).'''
+    ordered, offsets = _results_index(column)
+    start, stop = offsets.get(value, (0, 0))
+    return ordered.iloc[start:stop]
+
+
+def index_keys(column):
+    '''Every distinct value of ``column``, in sorted order.'''
+    ordered, offsets = _results_index(column)
+    return sorted(offsets)
@@ -0,0 +1,101 @@
+'''
+Append a new competition year to the results store without a full rebuild.
+
+    python -m fsaem.ingest FSAEM_2016_results.xlsx
+
+The new workbook must have the same columns as FSAEM_summarized_results.xlsx
+and only contain years that aren't loaded yet. Each of its years is validated
+against fsaem.data.SCHEMA and written as its own store under
+fsaem.data.INGEST_DIR. Teams keep their Team ID, also when a spelling differs
+slightly from earlier years (see fsaem.teams); every such match is reported
+so it can be checked. Running dashboards and the data API pick the new years
+up on their next request; the per-year aggregates, indexes and API responses
+are extended with the new rows instead of being rebuilt from all of history.
+'''
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from fsaem.data import COLUMNS, RESULTS_FILE, SCHEMA, ingest_dir, load_results, write_store
+from fsaem.teams import add_team_ids
+from fsaem.xlsx import read_columns
+
+
+def read_new_results(path):
+    '''Read and validate a workbook of new results, returning a normalized frame.'''
+    # Read Year as a float so blank years can be reported instead of failing
+    dtypes = dict(SCHEMA, Year='float64')
+    try:
+        columns = read_columns(path, COLUMNS, dtypes=dtypes)
+    except KeyError as error:
+        raise ValueError("%s doesn't match the results schema: %s" % (path, error.args[0]))
+
+    rows = pd.DataFrame(columns, columns=COLUMNS)
+    if rows.empty:
+        raise ValueError("%s has no results" % path)
+
+    problems = []
+    if rows['Year'].isnull().any():
+        problems.append("%d rows have no Year" % rows['Year'].isnull().sum())
+    elif (rows['Year'] != np.round(rows['Year'])).any():
+        problems.append("Year must be a whole number")
+    if rows['Team'].isnull().any():
+        problems.append("%d rows have no Team" % rows['Team'].isnull().sum())
+    if problems:
+        raise ValueError("%s is invalid: %s" % (path, '; '.join(problems)))
+
+    rows['Year'] = rows['Year'].astype('int64')
+    return rows
+
+
+def ingest(path, workbook=RESULTS_FILE):
+    '''
+    Append every year in ``path`` to the store of ``workbook``, returning the
+    years and the teams matched to a differently spelled known team.
+    '''
+    rows = read_new_results(path)
+    loaded = load_results(workbook)
+
+    loaded_years = set(loaded['Year'].unique())
+    new_years = sorted(rows['Year'].unique().tolist())
+    duplicates = loaded_years.intersection(new_years)
+    if duplicates:
+        raise ValueError("Years already loaded: %s" % ', '.join(map(str, sorted(duplicates))))
+
+    rows, matches = add_team_ids(rows, known=loaded, fuzzy=True)
+
+    for year in new_years:
+        year_rows = rows.loc[rows['Year'] == year].reset_index(drop=True)
+        year_rows['Team'] = year_rows['Team'].cat.remove_unused_categories()
+        year_rows['Country'] = year_rows['Country'].cat.remove_unused_categories()
+        write_store(year_rows, os.path.join(ingest_dir(workbook), '%d' % year))
+
+    return new_years, matches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append new competition years to the FSAEM results")
+    parser.add_argument('results', help="Workbook with the new years' results")
+    parser.add_argument('--workbook', default=RESULTS_FILE,
+                        help="Results workbook the years are appended to")
+    args = parser.parse_args(argv)
+
+    try:
+        years, matches = ingest(args.results, args.workbook)
+    except ValueError as error:
+        parser.error(str(error))
+
+    for match in matches:
+        print("Matched %r to known team %d, %r (similarity %.2f)" %
+              (match.team, match.team_id, match.matched, match.score))
+
+    frame = load_results(args.workbook)
+    print("Ingested %s; %d results across %d years are now loaded" %
+          (', '.join(map(str, years)), len(frame), frame['Year'].nunique()))
+
+
+if __name__ == '__main__':
+    main()
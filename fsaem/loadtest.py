@@ -0,0 +1,289 @@
+'''
+Load test the dashboards with many concurrent Bokeh client sessions.
+
+No browser is involved: every simulated user is a bokeh.client session
+talking the same websocket protocol as the browser. Use
+
+    python -m fsaem.loadtest --sessions 50 --concurrency 10 team_rankings competition_forfeits
+
+to start ``python -m fsaem.server`` (or fsaem.cluster with --workers) on a
+free local port and open --sessions sessions, --concurrency at a time, spread
+over the given dashboards. Each session then changes a random dropdown to a
+random value --changes times, which runs the dashboard's on_change callback
+(on_year_change, on_event_change, ...) in the server. The report gives, per
+dashboard, the percentiles of
+
+    session   opening a session: the server running the script and the
+              client receiving the document
+    callback  changing a dropdown until the server's updates have arrived
+
+and the resident memory of the server and its workers, read from /proc,
+before, at the peak of and after the test. Use --url and --pid to test a
+server that is already running.
+'''
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+try:
+    from urllib.request import urlopen
+except ImportError:
+    from urllib2 import urlopen
+
+from fsaem.data import REPO_DIR
+
+DASHBOARDS = ['team_rankings', 'competition_forfeits']
+
+PERCENTILES = [50, 90, 99]
+
+# Seconds between server memory samples
+RSS_INTERVAL = 0.5
+
+log = logging.getLogger(__name__)
+
+
+def free_port():
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    port = listener.getsockname()[1]
+    listener.close()
+    return port
+
+
+def process_tree_rss(pid):
+    '''Resident memory in bytes of a process and all of its descendants.'''
+    children = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open('/proc/%s/stat' % name) as stat:
+                # The command name is in parentheses and may hold spaces
+                parent = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (IOError, OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(name))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open('/proc/%d/status' % current) as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+        except (IOError, OSError):
+            continue
+    return total
+
+
+class MemorySampler(threading.Thread):
+    '''Samples a process tree's resident memory until stopped.'''
+
+    def __init__(self, pid, interval=RSS_INTERVAL):
+        super(MemorySampler, self).__init__()
+        self.daemon = True
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.samples.append(process_tree_rss(self.pid))
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+        self.samples.append(process_tree_rss(self.pid))
+
+
+def start_server(port, workers=None):
+    '''Start fsaem.server, or fsaem.cluster when workers is given, on a local port.'''
+    if workers is None:
+        command = [sys.executable, '-m', 'fsaem.server']
+    else:
+        command = [sys.executable, '-m', 'fsaem.cluster', '--workers', str(workers)]
+    command += ['--address', '127.0.0.1', '--port', str(port),
+                '--host', '127.0.0.1:%d' % port, '--log-level', 'error']
+    return subprocess.Popen(command, cwd=REPO_DIR)
+
+
+def wait_for_server(url, dashboard, timeout=120):
+    '''Wait until the server renders a dashboard page.'''
+    deadline = time.time() + timeout
+    while True:
+        try:
+            if urlopen('%s/%s' % (url, dashboard), timeout=10).getcode() == 200:
+                return
+        except (IOError, OSError):
+            pass
+        if time.time() > deadline:
+            raise RuntimeError("%s didn't start within %d seconds" % (url, timeout))
+        time.sleep(0.5)
+
+
+def simulate_session(task):
+    '''
+    Open one session and change its dropdowns, returning the timings.
+
+    Runs in a pool process, each with its own client connection.
+    '''
+    from bokeh.client import pull_session
+    from bokeh.models.widgets import Select
+
+    url, dashboard, changes, seed = task
+    rng = random.Random(seed)
+    result = {'dashboard': dashboard, 'session': None, 'callbacks': [], 'error': None}
+    try:
+        start = time.time()
+        session = pull_session(url=url, app_path='/' + dashboard)
+        result['session'] = time.time() - start
+
+        selects = [select for select in session.document.select({'type': Select})
+                   if len(select.options) > 1]
+        for change in range(changes if selects else 0):
+            select = rng.choice(selects)
+            value = rng.choice([option for option in select.options if option != select.value])
+
+            # Setting the value pushes it to the server, which runs the callback;
+            # the server info round trip returns once its updates have arrived
+            start = time.time()
+            select.value = value
+            session.request_server_info()
+            result['callbacks'].append(time.time() - start)
+
+        session.close()
+    except Exception as error:
+        result['error'] = '%s: %s' % (type(error).__name__, error)
+    return result
+
+
+def _percentiles(values):
+    if not values:
+        return {}
+    summary = {'p%d' % percentile: float(np.percentile(values, percentile))
+               for percentile in PERCENTILES}
+    summary['max'] = float(max(values))
+    summary['count'] = len(values)
+    return summary
+
+
+def run(url, dashboards, sessions, concurrency, changes, seed=0, pid=None):
+    '''Simulate the sessions against a running server, returning the report.'''
+    sampler = None
+    if pid is not None:
+        sampler = MemorySampler(pid)
+        sampler.start()
+
+    tasks = [(url, dashboards[number % len(dashboards)], changes, seed + number)
+             for number in range(sessions)]
+    start = time.time()
+    pool = multiprocessing.Pool(processes=concurrency)
+    try:
+        results = pool.map(simulate_session, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    elapsed = time.time() - start
+
+    report = {'sessions': sessions, 'concurrency': concurrency,
+              'changes': changes, 'seconds': elapsed, 'dashboards': {}}
+    for dashboard in dashboards:
+        mine = [result for result in results if result['dashboard'] == dashboard]
+        report['dashboards'][dashboard] = {
+            'session': _percentiles([result['session'] for result in mine
+                                     if result['session'] is not None]),
+            'callback': _percentiles([latency for result in mine
+                                      for latency in result['callbacks']]),
+            'errors': [result['error'] for result in mine if result['error']]}
+
+    if sampler is not None:
+        sampler.stop()
+        report['server_rss'] = {'before': sampler.samples[0],
+                                'peak': max(sampler.samples),
+                                'after': sampler.samples[-1]}
+    return report
+
+
+def format_report(report):
+    lines = ["%d sessions, %d at a time, %d changes each, in %.1f s" %
+             (report['sessions'], report['concurrency'], report['changes'], report['seconds'])]
+    columns = ['p%d' % percentile for percentile in PERCENTILES] + ['max']
+    lines.append("%-32s %8s %s" % ('', 'count', ' '.join('%8s' % column for column in columns)))
+    for dashboard, timings in sorted(report['dashboards'].items()):
+        for phase in ['session', 'callback']:
+            summary = timings[phase]
+            if summary:
+                lines.append("%-32s %8d %s" % ('%s %s (ms)' % (dashboard, phase), summary['count'],
+                                               ' '.join('%8.1f' % (1000 * summary[column])
+                                                        for column in columns)))
+        if timings['errors']:
+            lines.append("%s: %d failed sessions, e.g. %s" %
+                         (dashboard, len(timings['errors']), timings['errors'][0]))
+    if 'server_rss' in report:
+        lines.append("Server RSS: %.1f MB before, %.1f MB peak, %.1f MB after" %
+                     tuple(report['server_rss'][key] / 2.0 ** 20 for key in ['before', 'peak', 'after']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the FSAE Michigan dashboards")
+    parser.add_argument('--sessions', type=int, default=20,
+                        help="Sessions to open in total")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Sessions open at once, one per core by default")
+    parser.add_argument('--changes', type=int, default=5,
+                        help="Dropdown changes per session")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Start fsaem.cluster with this many workers instead of fsaem.server")
+    parser.add_argument('--url', help="Test the server at this URL instead of starting one")
+    parser.add_argument('--pid', type=int, help="Process to measure the memory of with --url")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Also write the report to this file")
+    parser.add_argument('dashboards', nargs='*', default=DASHBOARDS,
+                        help="Dashboards to open sessions of")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    server = None
+    url, pid = args.url, args.pid
+    if url is None:
+        port = free_port()
+        url = 'http://127.0.0.1:%d' % port
+        server = start_server(port, args.workers)
+        pid = server.pid
+
+    try:
+        wait_for_server(url, args.dashboards[0])
+        report = run(url, args.dashboards, args.sessions,
+                     args.concurrency or multiprocessing.cpu_count(),
+                     args.changes, args.seed, pid)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(format_report(report))
+    if args.json:
+        with open(args.json, 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+'''
+Timing of each dashboard's sessions and callbacks.
+
+Every timed phase is appended to METRICS_FILE as one JSON object per line:
+
+    {"time": 1476712345.1, "pid": 4242, "dashboard": "team_rankings",
+     "session": "4242-7", "phase": "get_data", "seconds": 0.0031}
+
+Phases
+    load      reading the results from the store or the workbook
+    session   running a dashboard script for a new session
+    document  serializing a new session's document, with its size in 'bytes'
+    get_data  a dashboard's get_data call
+    chart     a dashboard's generate_chart call
+    callback  a widget callback, from the change to the updated models
+    session_end, session_expired
+              a session being discarded or expired, after 'seconds' alive
+
+fsaem.sessions also logs 'sessions' entries every SWEEP_INTERVAL seconds, the
+number of live sessions of a dashboard in one process and the total size of
+their documents.
+
+The dashboards run in the Bokeh server while /metrics is served by the WSGI
+app, so the file is the only thing they share. summarize aggregates it.
+Set FSAEM_METRICS_FILE to log elsewhere, or to an empty string to disable.
+The file is rotated to METRICS_FILE.1, .2, ... once it reaches MAX_BYTES.
+'''
+
+import collections
+import contextlib
+import functools
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import time
+import weakref
+
+from fsaem.data import CACHE_DIR
+
+METRICS_FILE = os.environ.get('FSAEM_METRICS_FILE', os.path.join(CACHE_DIR, 'metrics.jsonl'))
+
+# Size the log is rotated at, and how many rotated logs are kept
+MAX_BYTES = 16 << 20
+BACKUP_COUNT = 2
+
+# summarize only reads this much of the end of the log
+SUMMARY_BYTES = 4 << 20
+
+# Default seconds between the sweeps logging each process's live sessions
+SWEEP_INTERVAL = 60
+
+_log = logging.getLogger(__name__)
+_log.propagate = False
+
+# {document: session label}
+_sessions = weakref.WeakKeyDictionary()
+_session_numbers = itertools.count()
+
+
+class _RotatingHandler(logging.handlers.RotatingFileHandler):
+    '''Rotating log that reopens the file after another process rotated it.'''
+
+    def emit(self, record):
+        try:
+            rotated = os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+        except (AttributeError, OSError, ValueError):
+            # No stream opened yet, or the file was just renamed away
+            rotated = True
+        if rotated and self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        super(_RotatingHandler, self).emit(record)
+
+
+def _handler():
+    if not _log.handlers:
+        if not METRICS_FILE:
+            _log.addHandler(logging.NullHandler())
+        else:
+            if not os.path.isdir(os.path.dirname(METRICS_FILE)):
+                os.makedirs(os.path.dirname(METRICS_FILE))
+            handler = _RotatingHandler(METRICS_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            _log.addHandler(handler)
+            _log.setLevel(logging.INFO)
+    return _log
+
+
+def session_id(document):
+    '''Label of the session a document belongs to, unique across processes.'''
+    if document not in _sessions:
+        _sessions[document] = '%d-%d' % (os.getpid(), next(_session_numbers))
+    return _sessions[document]
+
+
+def record(phase, seconds, **fields):
+    '''Append one timed phase to the metrics log.'''
+    entry = {'time': time.time(), 'pid': os.getpid(),
+             'phase': phase, 'seconds': seconds}
+    entry.update(fields)
+    _handler().info(json.dumps(entry, sort_keys=True))
+
+
+@contextlib.contextmanager
+def timer(phase, **fields):
+    '''
+    Time the body of a ``with`` block as ``phase``.
+
+    The block receives the fields dict and may add to it before it is logged.
+    '''
+    start = time.time()
+    try:
+        yield fields
+    finally:
+        record(phase, time.time() - start, **fields)
+
+
+def timed(phase):
+    '''
+    Decorate a dashboard function so every call is timed as ``phase``.
+
+    The dashboard is named after the function's script, and the session is the
+    document being built when the script defined the function.
+    '''
+    def decorator(function):
+        from bokeh.io import curdoc
+
+        fields = {'dashboard': os.path.splitext(os.path.basename(function.__code__.co_filename))[0],
+                  'session': session_id(curdoc())}
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with timer(phase, **fields):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _describe(values):
+    ordered = sorted(values)
+    return {'count': len(ordered),
+            'mean': sum(ordered) / len(ordered),
+            'p50': _percentile(ordered, 0.5),
+            'p95': _percentile(ordered, 0.95),
+            'max': ordered[-1]}
+
+
+def _tail_lines(path, max_bytes):
+    if not os.path.isfile(path):
+        return [], 0
+
+    with open(path, 'rb') as log_file:
+        log_file.seek(0, os.SEEK_END)
+        size = log_file.tell()
+        log_file.seek(max(0, size - max_bytes))
+        lines = log_file.read().splitlines()
+
+    if size > max_bytes:
+        # The first line is most likely cut in half
+        lines = lines[1:]
+    return lines, min(size, max_bytes)
+
+
+def read_entries(path=METRICS_FILE, max_bytes=SUMMARY_BYTES):
+    '''The most recent entries of a metrics log, and of its last rotation, oldest first.'''
+    if not path:
+        return []
+
+    lines, read = _tail_lines(path, max_bytes)
+    if read < max_bytes:
+        lines = _tail_lines(path + '.1', max_bytes - read)[0] + lines
+
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line.decode('utf-8')))
+        except ValueError:
+            continue
+    return entries
+
+
+def summarize(entries, now=None, stale_after=1.5 * SWEEP_INTERVAL):
+    '''
+    Aggregate metrics log entries.
+
+    Returns {dashboard: {phase: {'count', 'mean', 'p50', 'p95', 'max'}}} of
+    the seconds spent in each phase, plus a 'document_bytes' entry holding the
+    same statistics of the sampled document sizes and a 'live' entry with
+    the latest session count and size reported by every process. Processes
+    that logged nothing for ``stale_after`` seconds, a sweep interval with
+    some slack, have exited and don't count as live. Phases logged outside a
+    dashboard, such as load, are listed under '*'.
+    '''
+    if now is None:
+        now = time.time()
+
+    seconds = collections.defaultdict(lambda: collections.defaultdict(list))
+    sizes = collections.defaultdict(list)
+    live = collections.defaultdict(dict)
+    last_seen = {}
+    for entry in entries:
+        dashboard = entry.get('dashboard', '*')
+        last_seen[entry['pid']] = max(entry['time'], last_seen.get(entry['pid'], 0))
+        if entry['phase'] == 'sessions':
+            live[dashboard][entry['pid']] = entry
+            continue
+        seconds[dashboard][entry['phase']].append(entry['seconds'])
+        if entry['phase'] == 'document':
+            sizes[dashboard].append(entry['bytes'])
+
+    summary = collections.defaultdict(dict)
+    for dashboard, phases in seconds.items():
+        summary[dashboard] = {phase: _describe(values) for phase, values in phases.items()}
+        if sizes[dashboard]:
+            summary[dashboard]['document_bytes'] = _describe(sizes[dashboard])
+    for dashboard, processes in live.items():
+        processes = dict((pid, entry) for pid, entry in processes.items()
+                         if now - last_seen[pid] <= stale_after)
+        summary[dashboard]['live'] = {'sessions': sum(entry['sessions'] for entry in processes.values()),
+                                      'bytes': sum(entry['bytes'] for entry in processes.values())}
+    return dict(summary)
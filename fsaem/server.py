@@ -0,0 +1,189 @@
+'''
+Serve every dashboard from a single Bokeh server process.
+
+All apps share one process, so the results workbook, its aggregates and its
+indexes are loaded once when the server starts and every session of every
+dashboard reads the same frame. Use
+
+    python -m fsaem.server --port 5006
+
+instead of ``bokeh serve *.py``. Each dashboard is served at /<script name>,
+e.g. /team_rankings. Sessions are discarded --unused-session-lifetime
+seconds after their browser disconnects, and expired by fsaem.sessions once
+idle for --idle-session-lifetime seconds or bigger than --max-session-bytes.
+
+Before serving, every module the dashboards import is imported and each
+script is run once, so no visitor's session pays for the imports, templates
+or aggregates; --no-preload skips that.
+'''
+
+import argparse
+import ast
+import importlib
+import logging
+import os
+import time
+
+from bokeh.application import Application
+from bokeh.application.handlers import ScriptHandler
+from bokeh.document import Document
+from bokeh.server.server import Server
+from tornado.ioloop import PeriodicCallback
+
+from fsaem.aggregates import year_statistics
+from fsaem.data import REPO_DIR, load_results
+from fsaem.index import index_keys
+from fsaem.teams import team_names
+from fsaem.metrics import SWEEP_INTERVAL, record, session_id, timer
+from fsaem.sessions import CHECK_SHARED, check_shared, sweep, track
+
+DASHBOARDS = ['competition_cylinders',
+              'competition_forfeits',
+              'competition_geography',
+              'competition_weight',
+              'historic_average',
+              'historic_histogram',
+              'historic_histogram_interactive',
+              'team_historic',
+              'team_place_trend',
+              'team_progress',
+              'team_rankings']
+
+# Serializing a document to log its size costs about as much as sending it,
+# so only the first and then every DOCUMENT_SAMPLE-th session of a dashboard
+# is measured; FSAEM_DOCUMENT_SAMPLE=0 measures none
+DOCUMENT_SAMPLE = int(os.environ.get('FSAEM_DOCUMENT_SAMPLE', '100'))
+
+log = logging.getLogger(__name__)
+
+
+class TimedScriptHandler(ScriptHandler):
+    '''
+    ScriptHandler logging how long each session takes to build, and for a
+    sample of sessions how long its document takes to serialize.
+    '''
+
+    def __init__(self, filename):
+        super(TimedScriptHandler, self).__init__(filename=filename)
+        self.dashboard = os.path.splitext(os.path.basename(filename))[0]
+        self.sessions = 0
+
+    def modify_document(self, doc):
+        session = session_id(doc)
+
+        # Tracked first, so the script can register on_session_destroyed callbacks
+        track(doc, self.dashboard)
+
+        with timer('session', dashboard=self.dashboard, session=session):
+            super(TimedScriptHandler, self).modify_document(doc)
+
+        if DOCUMENT_SAMPLE and self.sessions % DOCUMENT_SAMPLE == 0:
+            start = time.time()
+            document_bytes = len(doc.to_json_string())
+            record('document', time.time() - start, dashboard=self.dashboard,
+                   session=session, bytes=document_bytes)
+        self.sessions += 1
+
+        if CHECK_SHARED:
+            check_shared(self.dashboard)
+
+
+def make_applications(dashboards=DASHBOARDS):
+    applications = {}
+    for name in dashboards:
+        application = Application()
+        application.add(TimedScriptHandler(filename=os.path.join(REPO_DIR, name + '.py')))
+        applications['/' + name] = application
+    return applications
+
+
+def dashboard_imports(name):
+    '''Modules a dashboard script imports.'''
+    with open(os.path.join(REPO_DIR, name + '.py')) as script:
+        tree = ast.parse(script.read())
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return sorted(set(modules))
+
+
+def preload(dashboards=DASHBOARDS):
+    '''
+    Import every module the dashboards use and run each of them once.
+
+    bokeh serve runs a dashboard's script for every session; doing it once up
+    front moves the imports, templates and memoized data of every first
+    session to server start.
+    '''
+    for name in dashboards:
+        for module in dashboard_imports(name):
+            importlib.import_module(module)
+
+    for name in dashboards:
+        handler = ScriptHandler(filename=os.path.join(REPO_DIR, name + '.py'))
+        handler.modify_document(Document())
+        if handler.failed:
+            log.error("Warming up %s failed: %s", name, handler.error)
+
+
+def load_shared_data():
+    '''Load the results and everything derived from them before any session.'''
+    load_results()
+    year_statistics()
+    index_keys('Year')
+    index_keys('Team ID')
+    team_names()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve every FSAE Michigan dashboard")
+    parser.add_argument('--address', default=None,
+                        help="Address to listen on")
+    parser.add_argument('--port', type=int, default=5006,
+                        help="Port to listen on")
+    parser.add_argument('--host', action='append', default=[],
+                        help="Public hostname[:port] allowed to connect; may be repeated")
+    parser.add_argument('--log-level', default='info',
+                        choices=['debug', 'info', 'warning', 'error', 'critical'])
+    parser.add_argument('--unused-session-lifetime', type=float, default=15,
+                        help="Seconds a session is kept after its browser disconnects")
+    parser.add_argument('--check-unused-sessions', type=float, default=17,
+                        help="Seconds between looking for disconnected sessions")
+    parser.add_argument('--idle-session-lifetime', type=float, default=1800,
+                        help="Seconds without interaction before a session expires, 0 for never")
+    parser.add_argument('--max-session-bytes', type=int, default=0,
+                        help="Serialized document size a session expires at, 0 for no limit")
+    parser.add_argument('--sweep-interval', type=float, default=SWEEP_INTERVAL,
+                        help="Seconds between expiring sessions and logging their memory")
+    parser.add_argument('--no-preload', action='store_true',
+                        help="Don't import and run every dashboard before serving")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+
+    load_shared_data()
+    if not args.no_preload:
+        preload()
+
+    server_options = {'port': args.port,
+                      'unused_session_lifetime_milliseconds': int(1000 * args.unused_session_lifetime),
+                      'check_unused_sessions_milliseconds': int(1000 * args.check_unused_sessions)}
+    if args.address:
+        server_options['address'] = args.address
+    if args.host:
+        server_options['host'] = args.host
+
+    server = Server(make_applications(), **server_options)
+    log.info("Serving %d dashboards on port %d", len(DASHBOARDS), args.port)
+
+    PeriodicCallback(lambda: sweep(args.idle_session_lifetime, args.max_session_bytes),
+                     int(1000 * args.sweep_interval)).start()
+    server.start()
+
+
+if __name__ == '__main__':
+    main()
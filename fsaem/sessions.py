@@ -0,0 +1,192 @@
+'''
+Lifecycle of the dashboards' server sessions.
+
+fsaem.server tracks every session before running its script. Bokeh discards
+a session some time after its browser disconnects; its document is then
+garbage collected, which runs the callbacks scripts registered with
+
+    from fsaem.sessions import on_session_destroyed
+    on_session_destroyed(curdoc(), get_data.cache_release)
+
+Documents built outside the server, by fsaem.export or fsaem.benchmark, are
+tracked on their first registration instead.
+
+A session whose browser stays connected but idle, or whose document grew
+past a size cap, is expired by sweep: its models are dropped and the page
+shows EXPIRED_TEXT instead, so an abandoned tab can't pin memory all weekend.
+
+Every session reads the same results frame from fsaem.data. Its columns are
+read-only arrays, so writing to them in place raises in the session that
+tries. Replacing or adding a column of the shared frame can't be prevented
+that way; sweep catches it by comparing a checksum of the frame with the one
+taken when it was loaded. Set FSAEM_CHECK_SHARED=1 to also check after every
+new session, which names the dashboard that modified it.
+'''
+
+import collections
+import gc
+import hashlib
+import logging
+import os
+import time
+import weakref
+
+import numpy as np
+
+from fsaem.data import load_results
+from fsaem.metrics import record, session_id
+
+EXPIRED_TEXT = "This page expired after being left idle. Reload it to continue."
+
+# Dashboard of sessions whose document wasn't built by fsaem.server
+UNTRACKED = '*'
+
+CHECK_SHARED = os.environ.get('FSAEM_CHECK_SHARED', '') not in ('', '0')
+
+log = logging.getLogger(__name__)
+
+
+class _Session(object):
+    def __init__(self, document, dashboard):
+        self.id = session_id(document)
+        self.dashboard = dashboard
+        self.document = weakref.ref(document)
+        self.created = self.last_active = time.time()
+        self.bytes = None
+        self.expired = False
+        self.destroyed_callbacks = []
+
+    def touch(self, event):
+        self.last_active = time.time()
+        self.bytes = None
+
+
+# {session id: _Session} of every session whose document is alive
+_sessions = {}
+
+# Every dashboard a session was tracked for, so counts dropping to zero are logged
+_dashboards = set()
+
+# (frame, checksum) of the results frame last checked
+_shared = (None, None)
+
+
+def track(document, dashboard):
+    '''Start tracking a new session's document, returning its session.'''
+    session = _Session(document, dashboard)
+    _sessions[session.id] = session
+    if dashboard != UNTRACKED:
+        _dashboards.add(dashboard)
+
+    # The callback lives on the document, so it doesn't keep the document alive
+    document.on_change(session.touch)
+    weakref.finalize(document, _destroyed, session)
+    return session
+
+
+def on_session_destroyed(document, callback):
+    '''
+    Call ``callback()`` once the session of ``document`` has been discarded.
+
+    The callback must not reference the document or its models, or the
+    session can never be collected. Functions defined in a dashboard script
+    reference its models through the script's globals, so register functions
+    from the fsaem package, such as a memoized function's cache_release.
+    '''
+    session = _sessions.get(session_id(document))
+    if session is None:
+        session = track(document, UNTRACKED)
+    session.destroyed_callbacks.append(callback)
+
+
+def _destroyed(session):
+    _sessions.pop(session.id, None)
+    for callback in session.destroyed_callbacks:
+        try:
+            callback()
+        except Exception:
+            log.exception("Cleaning up session %s of %s failed", session.id, session.dashboard)
+    record('session_end', time.time() - session.created,
+           dashboard=session.dashboard, session=session.id)
+
+
+def expire(session, reason):
+    '''Drop a live session's models, leaving a note to reload the page.'''
+    from bokeh.models.widgets import Paragraph
+
+    document = session.document()
+    if document is None or session.expired:
+        return
+
+    session.expired = True
+    document.clear()
+    document.add_root(Paragraph(text=EXPIRED_TEXT))
+    session.bytes = None
+    record('session_expired', time.time() - session.created,
+           dashboard=session.dashboard, session=session.id, reason=reason)
+
+
+def session_bytes(session):
+    '''Size of a session's serialized document, remeasured after it changed.'''
+    if session.bytes is None:
+        document = session.document()
+        session.bytes = len(document.to_json_string()) if document is not None else 0
+    return session.bytes
+
+
+def session_stats():
+    '''{dashboard: {'sessions': live sessions, 'bytes': their total document size}}'''
+    stats = collections.defaultdict(lambda: {'sessions': 0, 'bytes': 0})
+    for session in list(_sessions.values()):
+        stats[session.dashboard]['sessions'] += 1
+        stats[session.dashboard]['bytes'] += session_bytes(session)
+    return dict(stats)
+
+
+def sweep(idle_lifetime=None, max_bytes=None):
+    '''
+    Expire sessions idle for more than ``idle_lifetime`` seconds or larger
+    than ``max_bytes``, release discarded ones and log what is left.
+    '''
+    gc.collect()
+
+    now = time.time()
+    for session in list(_sessions.values()):
+        if session.expired:
+            continue
+        if idle_lifetime and now - session.last_active > idle_lifetime:
+            expire(session, 'idle')
+        elif max_bytes and session_bytes(session) > max_bytes:
+            expire(session, 'size')
+
+    check_shared()
+
+    stats = session_stats()
+    for dashboard in _dashboards:
+        record('sessions', 0, dashboard=dashboard,
+               **stats.get(dashboard, {'sessions': 0, 'bytes': 0}))
+    return stats
+
+
+def data_checksum(frame):
+    sha1 = hashlib.sha1()
+    for column in frame.columns:
+        values = frame[column].values
+        if hasattr(values, 'codes'):
+            values = values.codes
+        sha1.update(np.ascontiguousarray(values).view(np.uint8))
+    return sha1.hexdigest()
+
+
+def check_shared(dashboard=None):
+    '''Log an error if the shared results frame was modified since last checked.'''
+    global _shared
+
+    frame = load_results()
+    checksum = data_checksum(frame)
+    if _shared[0] is frame and _shared[1] != checksum:
+        log.error("The shared results were modified in place%s",
+                  " by a session of %s" % dashboard if dashboard else "")
+        record('shared_data_modified', 0, dashboard=dashboard or '*')
+    _shared = (frame, checksum)
+    return checksum
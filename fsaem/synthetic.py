@@ -0,0 +1,195 @@
+'''
+Synthetic results in the FSAEM schema, for testing the dashboards at scale.
+
+The real workbook only holds a few thousand results. generate resamples it
+into as many teams and years as asked for:
+
+    python -m fsaem.synthetic synthetic.xlsx --scale 100 --dnf-rate 0.3
+
+Every result is stitched together from real results of the same year, one
+group of related columns at a time (the car, each static event, each dynamic
+event with its times), so the scores, DNF rates and columns missing in early
+years follow the real data while teams get new combinations. Totals and
+places are recomputed from the scores. write_results writes the workbook and
+the store load_results reads it from, so the dashboards can be pointed at it
+with FSAEM_RESULTS_FILE without parsing the workbook first.
+'''
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from fsaem.data import COLUMNS, SCHEMA, load_results, store_path, write_store
+from fsaem.teams import add_team_ids
+
+# Columns drawn together from one real result. The first column of a dynamic
+# event is its score; its other columns are times, blank when the car DNFs
+CAR_COLUMNS = ['Engine Cylinders', 'Engine Displacement (cc)', 'Weight (kg)', 'Weight (lbs)']
+STATIC_EVENTS = [['Penalty'], ['Cost Score'], ['Presentation Score'], ['Design Score']]
+DYNAMIC_EVENTS = [['Acceleration Score', 'Accel Best Time'],
+                  ['Skid Pad Score', 'Skid Pad Best Time'],
+                  ['Autocross Score', 'AutoX Best Time'],
+                  ['Endurance Score', 'Efficiency Score', 'Endurance Time',
+                   'Endurance Cones', 'Endurance Off Course', 'Endurance Adjusted Time']]
+
+SCORE_COLUMNS = ['Penalty', 'Cost Score', 'Presentation Score', 'Design Score',
+                 'Acceleration Score', 'Skid Pad Score', 'Autocross Score',
+                 'Endurance Score', 'Efficiency Score']
+
+# Columns jittered by ``noise``, so resampled results aren't exact copies
+_NOISY_COLUMNS = ['Cost Score', 'Presentation Score', 'Design Score',
+                  'Acceleration Score', 'Skid Pad Score', 'Autocross Score',
+                  'Endurance Score', 'Efficiency Score', 'Weight (kg)',
+                  'Endurance Time', 'Endurance Adjusted Time', 'AutoX Best Time',
+                  'Skid Pad Best Time', 'Accel Best Time']
+
+
+def generate(scale=1.0, years=None, teams_per_year=None, team_pool=2.0,
+             dnf_rate=None, spread=0.15, noise=0.02, seed=0, source=None):
+    '''
+    Synthetic results normalized to fsaem.data.SCHEMA.
+
+    scale           multiple of the real number of teams per year
+    years           years to generate, the real years by default; later years
+                    cycle through the real ones
+    teams_per_year  overrides scale
+    team_pool       teams to draw each year's entrants from, as a multiple of
+                    teams_per_year, so teams return year after year
+    dnf_rate        chance of each dynamic event being a DNF, the real rate
+                    of each event and year by default
+    spread          how far each event strays from a team's overall standing,
+                    as a fraction of the field; 0 draws every event from the
+                    same real result, 1 or more makes them nearly independent
+    noise           standard deviation of the relative jitter added to scores,
+                    times and weights
+    source          results to resample, load_results() by default
+    '''
+    rng = np.random.RandomState(seed)
+    if source is None:
+        source = load_results()
+
+    source_years = sorted(source['Year'].unique())
+    if years is None:
+        years = source_years
+    if teams_per_year is None:
+        teams_per_year = int(round(scale * len(source) / len(source_years)))
+    teams_per_year = max(1, teams_per_year)
+
+    # Every team keeps its country across years
+    pool_size = max(teams_per_year, int(team_pool * teams_per_year))
+    team_names = np.array(['Team %0*d' % (len(str(pool_size)), number + 1)
+                           for number in range(pool_size)])
+    countries = source['Country'].astype(str).values
+    team_countries = countries[rng.randint(len(countries), size=pool_size)]
+
+    frames = [_generate_year(rng, source, year, source_years[index % len(source_years)],
+                             teams_per_year, team_names, team_countries,
+                             dnf_rate, spread, noise)
+              for index, year in enumerate(years)]
+    frame = pd.concat(frames, ignore_index=True)
+
+    for name, dtype in SCHEMA:
+        frame[name] = frame[name].astype(dtype)
+    return frame[COLUMNS]
+
+
+def _generate_year(rng, source, year, source_year, entrants, team_names,
+                   team_countries, dnf_rate, spread, noise):
+    real = source.loc[source['Year'] == source_year]
+    teams = rng.choice(len(team_names), size=entrants, replace=False)
+
+    columns = {'Year': np.full(entrants, year, dtype='int64'),
+               'Car Num': np.arange(1, entrants + 1, dtype='float64'),
+               'Team': team_names[teams],
+               'Country': team_countries[teams]}
+
+    # Teams that withdrew have no scores in the real data; keep them blank
+    withdrawn = rng.random_sample(entrants) < real['Total Score'].isnull().mean()
+    placed_rows = real.loc[real['Total Score'].notnull()].sort_values(by='Total Score')
+
+    # Good teams tend to do well in every event: each group is drawn from the
+    # real results ranked near the team's standing
+    standing = rng.random_sample(entrants)
+    for group in [CAR_COLUMNS] + STATIC_EVENTS + DYNAMIC_EVENTS:
+        ranks = standing + spread * rng.standard_normal(entrants)
+        ranks = np.abs(ranks) % 2
+        ranks = np.where(ranks > 1, 2 - ranks, ranks)
+        picks = np.minimum((ranks * len(placed_rows)).astype(int), len(placed_rows) - 1)
+        for column in group:
+            values = placed_rows[column].values[picks].astype('float64')
+            values[withdrawn] = np.nan
+            columns[column] = values
+
+    if dnf_rate is not None:
+        for group in DYNAMIC_EVENTS:
+            dnfs = (rng.random_sample(entrants) < dnf_rate) & ~withdrawn
+            for column in group:
+                columns[column][dnfs] = 0.0 if column in SCORE_COLUMNS else np.nan
+
+    for column in _NOISY_COLUMNS:
+        columns[column] = columns[column] * (1 + noise * rng.standard_normal(entrants))
+        columns[column] = np.clip(columns[column], 0, None)
+    columns['Weight (lbs)'] = columns['Weight (kg)'] * 2.20462
+
+    # Penalties are the only negative scores; missing ones count as zero
+    scores = np.column_stack([np.nan_to_num(columns[column]) for column in SCORE_COLUMNS])
+    total = scores.sum(axis=1)
+    total[withdrawn] = np.nan
+    columns['Total Score'] = total
+
+    place = np.full(entrants, np.nan)
+    placed = np.flatnonzero(~withdrawn)
+    place[placed[np.argsort(-total[placed], kind='mergesort')]] = np.arange(1, len(placed) + 1)
+    columns['Place'] = place
+
+    frame = pd.DataFrame(columns, columns=COLUMNS)
+    return frame.sort_values(by=['Place', 'Car Num'], na_position='last')
+
+
+def write_results(frame, path, store=True):
+    '''Write a results frame as a workbook and, unless store is False, as its store.'''
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    staging = path + '.tmp.xlsx'
+    frame.to_excel(staging, index=False)
+    os.rename(staging, path)
+
+    if store:
+        write_store(add_team_ids(frame.reset_index(drop=True))[0], store_path(path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic FSAE Michigan results")
+    parser.add_argument('output', help="Workbook to write")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiple of the real number of teams per year")
+    parser.add_argument('--teams-per-year', type=int,
+                        help="Teams per year, overrides --scale")
+    parser.add_argument('--years', type=int, nargs=2, metavar=('FIRST', 'LAST'),
+                        help="Years to generate, the real years by default")
+    parser.add_argument('--dnf-rate', type=float,
+                        help="Chance of each dynamic event being a DNF")
+    parser.add_argument('--spread', type=float, default=0.15,
+                        help="How independent a team's events are, from 0 to 1")
+    parser.add_argument('--noise', type=float, default=0.02,
+                        help="Relative jitter of scores, times and weights")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-store', action='store_true',
+                        help="Only write the workbook, so the first load parses it")
+    args = parser.parse_args(argv)
+
+    years = list(range(args.years[0], args.years[1] + 1)) if args.years else None
+    frame = generate(scale=args.scale, years=years, teams_per_year=args.teams_per_year,
+                     dnf_rate=args.dnf_rate, spread=args.spread, noise=args.noise,
+                     seed=args.seed)
+    write_results(frame, args.output, store=not args.no_store)
+    print("Wrote %d results across %d years to %s" %
+          (len(frame), frame['Year'].nunique(), args.output))
+
+
+if __name__ == '__main__':
+    main()
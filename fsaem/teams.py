@@ -0,0 +1,214 @@
+'''
+Canonical team identities across the years' differing spellings.
+
+The workbook names a team however it registered that year: "Universite
+Laval" and "Université Laval", "IUPUI" and "Indiana Univ Purdue Univ
+Indianapolis", names with trailing or non-breaking spaces. Grouping by the
+raw Team strings splits such a team into several. Every result is therefore
+given an integer 'Team ID' when the store is built:
+
+    team_key     normalizes a spelling: case, accents, punctuation and the
+                 common abbreviations (Univ, Inst, Tech, ...) are folded
+    ALIASES      maps spellings whose keys still differ to another spelling
+                 of the same team
+    TeamMatcher  matches a new year's spelling to a known team by the
+                 trigrams of its key, for ``python -m fsaem.ingest``
+
+A team's canonical name is its spelling in the latest year it competed, see
+team_names. IDs are kept when years are ingested and reassigned only when
+the workbook itself changes, ingested years' teams included; results without
+a team get NO_TEAM.
+'''
+
+import collections
+import re
+import unicodedata
+
+import numpy as np
+
+from fsaem.data import derived
+
+NO_TEAM = -1
+
+# Spellings of the same team that normalize differently, to another of its
+# spellings. Add an entry whenever ingest reports a team it couldn't match.
+ALIASES = {'IUPUI': 'Indiana Univ Purdue Univ Indianapolis',
+           'Polytechnique Montréal': 'Ecole Polytechnique De Montreal',
+           'Leeds University': 'University of Leeds'}
+
+# Words abbreviated inconsistently across the years
+_ABBREVIATIONS = {'univ': 'university',
+                  'inst': 'institute',
+                  'tech': 'technology',
+                  'coll': 'college',
+                  'comm': 'community',
+                  'sch': 'school',
+                  'st': 'saint',
+                  'w': 'west',
+                  'aero': 'aeronautical'}
+
+# Smallest trigram similarity, from 0 to 1, at which a new spelling is taken
+# to be a known team, and by how much it must beat the next best team
+MATCH_THRESHOLD = 0.8
+MATCH_MARGIN = 0.1
+
+# Smallest similarity of a misspelled word to the word it stands for
+WORD_THRESHOLD = 0.6
+
+_Match = collections.namedtuple('_Match', ['team', 'team_id', 'matched', 'score'])
+
+
+def team_key(name):
+    '''Normalized form of a team's name; spellings of one team share a key.'''
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    name = re.sub(r'[^a-z0-9]+', ' ', name.lower().replace('&', ' and '))
+    return ' '.join(_ABBREVIATIONS.get(word, word) for word in name.split())
+
+
+_ALIAS_KEYS = dict((team_key(alias), team_key(name)) for alias, name in ALIASES.items())
+
+
+def _resolved_key(name):
+    key = team_key(name)
+    return _ALIAS_KEYS.get(key, key)
+
+
+def trigrams(key):
+    padded = '  %s ' % key
+    return set(padded[index:index + 3] for index in range(len(padded) - 2))
+
+
+def similarity(first, second):
+    '''Dice coefficient of two strings' trigrams, from 0 to 1.'''
+    first, second = trigrams(first), trigrams(second)
+    return 2.0 * len(first & second) / (len(first) + len(second))
+
+
+def _words_agree(key, known):
+    # A misspelling changes letters of a word; a word the other spelling
+    # lacks entirely names another campus or school, e.g. Michigan - Dearborn
+    # and Michigan - Ann Arbor
+    words, known_words = key.split(), known.split()
+    missing = [word for word in words if word not in known_words]
+    extra = [word for word in known_words if word not in words]
+    if len(missing) != len(extra):
+        return False
+    return all(similarity(word, other) >= WORD_THRESHOLD for word, other in zip(missing, extra))
+
+
+class TeamMatcher(object):
+    '''
+    Finds the known team closest to a spelling by the trigrams of its key.
+
+    Only teams sharing a trigram with the spelling are scored, through an
+    index of {trigram: keys}, so a match doesn't scan every known team.
+    '''
+
+    def __init__(self, keys=()):
+        self.ids = {}
+        self._trigrams = {}
+        self._index = collections.defaultdict(set)
+        for key, team_id in keys:
+            self.add(key, team_id)
+
+    def add(self, key, team_id):
+        self.ids[key] = team_id
+        self._trigrams[key] = trigrams(key)
+        for trigram in self._trigrams[key]:
+            self._index[trigram].add(key)
+
+    def scores(self, key):
+        '''[(similarity, known key)] of every known key sharing a trigram, best first.'''
+        grams = trigrams(key)
+        shared = collections.Counter()
+        for trigram in grams:
+            shared.update(self._index.get(trigram, ()))
+        # Dice coefficient of the two trigram sets
+        return sorted(((2.0 * count / (len(grams) + len(self._trigrams[known])), known)
+                       for known, count in shared.items()), reverse=True)
+
+    def match(self, key):
+        '''(team ID, matched key, similarity) of the team ``key`` belongs to, or None.'''
+        if key in self.ids:
+            return self.ids[key], key, 1.0
+
+        # Numbers tell teams apart that otherwise differ by a character or two
+        digits = re.findall(r'\d+', key)
+        teams = {}
+        for score, known in self.scores(key):
+            if re.findall(r'\d+', known) == digits and _words_agree(key, known):
+                teams.setdefault(self.ids[known], (score, known))
+        ranked = sorted(((score, known, team_id) for team_id, (score, known) in teams.items()),
+                        reverse=True)
+
+        if not ranked or ranked[0][0] < MATCH_THRESHOLD:
+            return None
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < MATCH_MARGIN:
+            return None
+        score, known, team_id = ranked[0]
+        return team_id, known, score
+
+
+def known_teams(frame):
+    '''TeamMatcher of every spelling in a frame that already has Team IDs.'''
+    pairs = frame.loc[frame['Team ID'] != NO_TEAM, ['Team', 'Team ID']].drop_duplicates()
+    return TeamMatcher((_resolved_key(str(team)), int(team_id))
+                       for team, team_id in zip(pairs['Team'], pairs['Team ID']))
+
+
+def add_team_ids(frame, known=None, fuzzy=False):
+    '''
+    Copy of a results frame with its 'Team ID' column.
+
+    ``known`` is a frame whose teams keep their IDs, e.g. the loaded results
+    when ingesting a new year; its other teams get new IDs after them. With
+    ``fuzzy``, spellings whose key is unknown are matched by TeamMatcher.
+    Returns the frame and the [(spelling, team ID, matched key, similarity)]
+    of the fuzzy matches made.
+    '''
+    matcher = known_teams(known) if known is not None else TeamMatcher()
+    next_id = max(matcher.ids.values()) + 1 if matcher.ids else 0
+
+    teams = frame['Team'].astype('category')
+    categories = [str(team) for team in teams.cat.categories]
+
+    # Teams new to ``known`` are numbered in key order, so a rebuilt store
+    # gives them the same IDs
+    matches = []
+    category_ids = np.empty(len(categories) + 1, dtype='int64')
+    category_ids[-1] = NO_TEAM
+    for index in sorted(range(len(categories)), key=lambda index: _resolved_key(categories[index])):
+        key = _resolved_key(categories[index])
+        if key not in matcher.ids:
+            match = matcher.match(key) if fuzzy else None
+            if match is None:
+                matcher.add(key, next_id)
+                next_id += 1
+            else:
+                matches.append(_Match(categories[index], *match))
+                matcher.add(key, match[0])
+        category_ids[index] = matcher.ids[key]
+
+    # Code -1, a missing team, picks the trailing NO_TEAM
+    frame = frame.copy()
+    frame['Team ID'] = category_ids[np.asarray(teams.cat.codes)]
+    return frame, matches
+
+
+def _team_names(frame):
+    latest = frame.loc[frame['Team ID'] != NO_TEAM, ['Year', 'Team', 'Team ID']]
+    latest = latest.sort_values(by='Year', kind='mergesort').drop_duplicates('Team ID', keep='last')
+    return dict((int(team_id), ' '.join(str(team).split()))
+                for team_id, team in zip(latest['Team ID'], latest['Team']))
+
+
+def team_names():
+    '''{team ID: canonical name}, the name being the team's latest spelling.'''
+    return derived('team_names', _team_names)
+
+
+def team_ids():
+    '''{canonical name: team ID}, the inverse of team_names.'''
+    return derived('team_ids', lambda frame: dict((name, team_id) for team_id, name
+                                                  in team_names().items()))
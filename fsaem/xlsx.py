@@ -0,0 +1,177 @@
+'''
+Streaming reader for the results workbook.
+
+An .xlsx file is a zip of XML parts. Rather than building every cell of the
+sheet like ``pd.read_excel``, read_columns walks the sheet XML with iterparse,
+keeps only the projected columns, drops rows failing the ``where`` predicates
+as soon as they end, and converts each column to the dtype given in
+fsaem.data.SCHEMA. Use
+
+    read_columns(RESULTS_FILE, ['Year', 'Engine Cylinders'],
+                 where={'Year': lambda year: year >= 2013})
+
+to get {column name: numpy array} for the 2013 onwards cylinder counts.
+'''
+
+import posixpath
+import re
+import zipfile
+from xml.etree import ElementTree
+
+import numpy as np
+import pandas as pd
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+_CELL_COLUMN = re.compile(r'[A-Z]+')
+
+
+def _column_index(reference):
+    '''Zero based column of a cell reference such as 'AB12'.'''
+    index = 0
+    for letter in _CELL_COLUMN.match(reference).group():
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def _first_sheet_path(workbook):
+    sheets = ElementTree.fromstring(workbook.read('xl/workbook.xml')).find(MAIN_NS + 'sheets')
+    sheet_id = sheets[0].get(REL_NS + 'id')
+
+    relationships = ElementTree.fromstring(workbook.read('xl/_rels/workbook.xml.rels'))
+    for relationship in relationships.iter(PACKAGE_REL_NS + 'Relationship'):
+        if relationship.get('Id') == sheet_id:
+            # Targets are relative to xl/, or to the package root when absolute
+            target = relationship.get('Target')
+            if target.startswith('/'):
+                return posixpath.normpath(target.lstrip('/'))
+            return posixpath.normpath(posixpath.join('xl', target))
+    raise KeyError("Workbook has no worksheet %s" % sheet_id)
+
+
+def _shared_strings(workbook):
+    if 'xl/sharedStrings.xml' not in workbook.namelist():
+        return []
+
+    strings = []
+    with workbook.open('xl/sharedStrings.xml') as part:
+        for event, element in ElementTree.iterparse(part):
+            if element.tag == MAIN_NS + 'si':
+                # Rich text is split over several <t> runs
+                strings.append(''.join(text.text or '' for text in element.iter(MAIN_NS + 't')))
+                element.clear()
+    return strings
+
+
+def _cell_value(cell, shared_strings):
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        return ''.join(text.text or '' for text in cell.iter(MAIN_NS + 't'))
+
+    value = cell.findtext(MAIN_NS + 'v')
+    if value is None:
+        return None
+    if cell_type == 's':
+        return shared_strings[int(value)]
+    if cell_type == 'n':
+        return float(value)
+    if cell_type == 'b':
+        return value == '1'
+    return value
+
+
+def _to_float(value):
+    # Mirrors pd.to_numeric(errors='coerce'): text such as 'DNF' becomes NaN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _typed(values, dtype, name=None, rows=None):
+    if dtype == 'category':
+        return pd.Categorical([value if value is None else str(value) for value in values])
+    if dtype is None:
+        return np.array(values, dtype=object)
+
+    floats = np.array([_to_float(value) for value in values], dtype=float)
+    if np.dtype(dtype).kind != 'f':
+        # Only float columns can hold NaN, casting it would invent a value
+        missing = np.flatnonzero(np.isnan(floats))
+        if len(missing):
+            raise ValueError("Row %d has no number in column %s" % (rows[missing[0]], name))
+    return floats.astype(dtype)
+
+
+def read_columns(path, columns=None, where=None, dtypes=None):
+    '''
+    Stream the first worksheet of ``path`` into typed arrays.
+
+    ``columns`` is the projection, by header name; all columns by default.
+    ``where`` maps column names to predicates on the typed value, and a row is
+    kept only if every predicate holds. ``dtypes`` maps column names to
+    'category' or a numpy dtype and defaults to fsaem.data.SCHEMA; columns
+    missing from it are returned as object arrays. A row without a number in
+    an integer column, such as a blank Year, raises ValueError.
+    '''
+    if dtypes is None:
+        from fsaem.data import SCHEMA
+        dtypes = dict(SCHEMA)
+    where = where or {}
+
+    with zipfile.ZipFile(path) as workbook:
+        shared_strings = _shared_strings(workbook)
+        sheet = workbook.open(_first_sheet_path(workbook))
+
+        header = None
+        wanted = {}
+        values = {}
+        rows = []
+        row = {}
+        row_number = 0
+        column = -1
+        for event, element in ElementTree.iterparse(sheet):
+            if element.tag == MAIN_NS + 'c':
+                # The cell reference is optional; without it a cell follows the previous one
+                reference = element.get('r')
+                column = _column_index(reference) if reference else column + 1
+                if header is None or column in wanted:
+                    row[column] = _cell_value(element, shared_strings)
+                element.clear()
+
+            elif element.tag == MAIN_NS + 'row':
+                # Like cells, rows number themselves only optionally
+                row_number = int(element.get('r', row_number + 1))
+                element.clear()
+                column = -1
+                if header is None:
+                    # The first row names the columns
+                    header = {index: name for index, name in row.items() if name is not None}
+                    names = columns if columns is not None else list(header.values())
+                    missing = set(names).union(where) - set(header.values())
+                    if missing:
+                        raise KeyError("Workbook has no columns %s" % sorted(missing))
+                    wanted = {index: name for index, name in header.items()
+                              if name in names or name in where}
+                    values = {name: [] for name in wanted.values()}
+                    row = {}
+                    continue
+
+                cells = {wanted[index]: value for index, value in row.items()}
+                row = {}
+                if not any(value is not None for value in cells.values()):
+                    continue
+                if not all(predicate(_typed([cells.get(name)], dtypes.get(name),
+                                            name, [row_number])[0])
+                           for name, predicate in where.items()):
+                    continue
+                rows.append(row_number)
+                for name in values:
+                    values[name].append(cells.get(name))
+
+        sheet.close()
+
+    names = columns if columns is not None else [header[index] for index in sorted(header)]
+    return {name: _typed(values[name], dtypes.get(name), name, rows) for name in names}
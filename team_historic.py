@@ -1,64 +1,66 @@
 #!/usr/bin/env python3
 
 from bokeh.models import HoverTool, ColumnDataSource, Range1d, FixedTicker
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
 from bokeh.io import curdoc
-from bokeh.models.widgets import Select, HBox
-from bokeh.palettes import Spectral11
-from bokeh.plotting import figure
 
 import random
-import math
-import numpy as np
-import pandas as pd
+
+from fsaem.charts import add_template_roots, styled_figure
+from fsaem.data import load_results
+from fsaem.index import group_offsets
+from fsaem.teams import team_names
 
 SCORED_EVENTS = ['Penalty', 'Cost Score', 'Presentation Score',
                  'Design Score', 'Acceleration Score', 'Skid Pad Score',
                  'Autocross Score', 'Endurance Score', 'Efficiency Score']
 
-# Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
-
-processed_data = compdata[['Year', 'Team', 'Total Score']]
-processed_data.loc[:,processed_data.columns != 'Team'] = processed_data.loc[:,processed_data.columns != 'Team'].apply(pd.to_numeric, errors='coerce')
-processed_data = processed_data.dropna()
-processed_data.sort_values(by='Year', ascending=False)
+def build_plot():
+    # Read in the FSAEM data
+    compdata = load_results()
 
-# Rename the Total Score column so the tooltip can access it
-processed_data = processed_data.rename(columns={'Total Score': 'Total_Score'})
+    processed_data = compdata[['Year', 'Team ID', 'Total Score']]
+    processed_data = processed_data.dropna()
+    processed_data.sort_values(by='Year', ascending=False)
 
-plot = figure(plot_width=800, plot_height=500, toolbar_location='right',
-              title="Formula SAE Michigan Total Score by Place",
-              tools="pan,wheel_zoom,box_zoom,reset,resize")
+    # Rename the Total Score column so the tooltip can access it
+    processed_data = processed_data.rename(columns={'Total Score': 'Total_Score'})
 
-plot.xaxis.axis_label = "Year"
-plot.xaxis.ticker = FixedTicker(ticks=processed_data['Year'].unique().astype(float))
+    plot = styled_figure({'title': "Formula SAE Michigan Total Score by Place",
+                          'x_label': "Year", 'y_label': "Total Score", 'axes': 'plain'})
 
-plot.yaxis.axis_label = "Total Score"
-plot.y_range = Range1d(0, 1000)
+    plot.xaxis.ticker = FixedTicker(ticks=processed_data['Year'].unique().astype(float))
+    plot.y_range = Range1d(0, 1000)
 
-plot.xgrid.grid_line_color = None
-plot.ygrid.grid_line_color = None
+    rand = lambda: random.randint(0,255)
+    generate_color = lambda: '#%02X%02X%02X' % (rand(),rand(),rand())
 
-plot.outline_line_color = None
+    # Pack every team's history into one source so the whole plot is a single
+    # multi_line renderer instead of one renderer and source per team. Teams
+    # are grouped by ID, so a team that changed its spelling stays one line
+    processed_data, team_offsets = group_offsets(processed_data, 'Team ID')
+    names = team_names()
+    teams = sorted(team_offsets, key=names.get)
 
-plot.logo = None
+    years = processed_data['Year'].values
+    scores = processed_data['Total_Score'].values
 
-hover = HoverTool(tooltips=[("Team", '@Team')])
+    data_source = ColumnDataSource(data={
+        'Team': [names[team] for team in teams],
+        'Year': [years[slice(*team_offsets[team])].tolist() for team in teams],
+        'Total_Score': [scores[slice(*team_offsets[team])].tolist() for team in teams],
+        'color': [generate_color() for team in teams]})
 
-plot.add_tools(hover)
+    lines = plot.multi_line(xs='Year', ys='Total_Score', source=data_source,
+                            line_width=1.3, color='grey', alpha=0.2,
+                            hover_color='color', hover_alpha=1)
 
-rand = lambda: random.randint(0,255)
-generate_color = lambda: '#%02X%02X%02X' % (rand(),rand(),rand())
+    # Highlight and label the team under the cursor
+    hover = HoverTool(renderers=[lines], tooltips=[("Team", '@Team')])
 
-for index, team in enumerate(processed_data['Team'].unique()):
-    data_source = ColumnDataSource(data=processed_data.loc[processed_data['Team'] == team])
+    plot.add_tools(hover)
 
-    color = generate_color()
+    return [plot]
 
-    line = plot.line(x='Year', y='Total_Score', source=data_source,
-                     line_width=1.3, color='grey', alpha=0.2, 
-                     hover_color=color, hover_alpha=1)
 
-curdoc().add_root(plot)
+# Bokeh plotting output, built once per process and copied for each session
+add_template_roots(curdoc(), 'team_historic', build_plot)
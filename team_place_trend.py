@@ -1,68 +1,71 @@
 #!/usr/bin/env python3
 
 from bokeh.models import HoverTool, ColumnDataSource
-from bokeh.charts import Bar
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
 from bokeh.io import curdoc
-from bokeh.models.widgets import Select, HBox
-from bokeh.palettes import Spectral11
-from bokeh.plotting import figure
 
 import random
-import math
-import numpy as np
-import pandas as pd
 
-# Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
-
-# Grab the total point data
-processed_data = compdata[['Year', 'Place', 'Team', 'Total Score']]
-processed_data.loc[:,processed_data.columns != 'Team'] = processed_data.loc[:,processed_data.columns != 'Team'].apply(pd.to_numeric, errors='coerce')
-processed_data = processed_data.dropna()
-processed_data.sort_values(by='Place', ascending=False)
-
-# Rename the Total Score column so the tooltip can access it
-processed_data = processed_data.rename(columns={'Total Score': 'Total_Score'})
-
-plot = figure(plot_width=800, plot_height=500, toolbar_location='right',
-              title="Formula SAE Michigan Total Score by Place",
-              tools="pan,wheel_zoom,box_zoom,reset,resize")
-
-plot.xaxis.axis_label = "Place"
-plot.xaxis.minor_tick_line_color = None
-
-plot.yaxis.axis_label = "Total Score"
-plot.yaxis.minor_tick_line_color = None
-
-plot.outline_line_color = None
-
-plot.logo = None
-
-rand = lambda: random.randint(0,255)
-generate_color = lambda: '#%02X%02X%02X' % (rand(),rand(),rand())
-
-for index, year in enumerate(processed_data['Year'].unique()):
-    data_source = ColumnDataSource(data=processed_data.loc[processed_data['Year'] == year])
-
-    color = generate_color()
-
-    line = plot.line(x='Place', y='Total_Score', source=data_source,
-                     line_width=1.5, color=color, alpha=1, hover_alpha=1)
-    dots = plot.circle(x='Place', y='Total_Score', source=data_source,
-                       size=8, alpha=0, color=color)
+from fsaem.charts import add_template_roots, styled_figure
+from fsaem.data import load_results
+from fsaem.index import group_offsets
+
+def build_plot():
+    # Read in the FSAEM data
+    compdata = load_results()
+
+    # Grab the total point data
+    processed_data = compdata[['Year', 'Place', 'Team', 'Total Score']]
+    processed_data = processed_data.dropna()
+    processed_data['Team'] = processed_data['Team'].astype(str)
+
+    # Rename the Total Score column so the tooltip can access it
+    processed_data = processed_data.rename(columns={'Total Score': 'Total_Score'})
+
+    plot = styled_figure({'title': "Formula SAE Michigan Total Score by Place",
+                          'x_label': "Place", 'y_label': "Total Score",
+                          'axes': 'plain', 'grid': True})
+
+    rand = lambda: random.randint(0,255)
+    generate_color = lambda: '#%02X%02X%02X' % (rand(),rand(),rand())
+
+    # Order each year's results by place so its line is drawn left to right
+    processed_data = processed_data.sort_values(by='Place')
+    processed_data, year_offsets = group_offsets(processed_data, 'Year')
+    years = sorted(year_offsets)
+    year_colors = {year: generate_color() for year in years}
+
+    places = processed_data['Place'].values
+    scores = processed_data['Total_Score'].values
+
+    # One row per year drives a single multi_line for every year's trend
+    line_source = ColumnDataSource(data={
+        'Year': years,
+        'Place': [places[slice(*year_offsets[year])].tolist() for year in years],
+        'Total_Score': [scores[slice(*year_offsets[year])].tolist() for year in years],
+        'color': [year_colors[year] for year in years]})
+
+    # One row per result drives a single scatter of invisible hover targets
+    dot_source = ColumnDataSource(data={
+        'Year': processed_data['Year'].tolist(),
+        'Team': processed_data['Team'].tolist(),
+        'Place': places.tolist(),
+        'Total_Score': scores.tolist(),
+        'color': [year_colors[year] for year in processed_data['Year']]})
+
+    lines = plot.multi_line(xs='Place', ys='Total_Score', source=line_source,
+                            line_width=1.5, color='color', alpha=1, hover_alpha=1)
+    dots = plot.circle(x='Place', y='Total_Score', source=dot_source,
+                       size=8, alpha=0, color='color')
     tooltip = HoverTool(renderers=[dots],
                         tooltips=[("Year", '@Year'),
                                   ("Team", '@Team'),
                                   ("Place", '@Place'),
                                   ("Total Score", '@Total_Score')])
 
-    # NOTE: Bokeh 0.11.0dev4 HoverTool for lines breaks the plot. Leave this in
-    #       for future implementation.
-    hover = HoverTool(renderers=[line], tooltips=None)
-
     plot.add_tools(tooltip)
 
+    return [plot]
+
 
-curdoc().add_root(plot)
+# Bokeh plotting output, built once per process and copied for each session
+add_template_roots(curdoc(), 'team_place_trend', build_plot)
@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 
-from bokeh.models import HoverTool, ColumnDataSource, Range1d, FixedTicker, GlyphRenderer
-from bokeh.charts import Bar
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
+from bokeh.models import HoverTool, ColumnDataSource, FixedTicker
 from bokeh.io import curdoc
-from bokeh.models.widgets import Select, HBox, VBox
+from bokeh.models.widgets import Select, VBox
 from bokeh.palettes import Spectral9
-from bokeh.plotting import Figure
 
 import random
-import numpy as np
-import pandas as pd
+
+from fsaem.cache import memoize
+from fsaem.charts import stack_column, stacked_bars, styled_figure
+from fsaem.data import load_results
+from fsaem.index import rows_for
+from fsaem.metrics import timed
+from fsaem.sessions import on_session_destroyed
+from fsaem.teams import NO_TEAM, team_ids
 
 
 SCORED_EVENTS = ['Penalty', 'Cost Score', 'Presentation Score',
@@ -19,104 +21,73 @@ SCORED_EVENTS = ['Penalty', 'Cost Score', 'Presentation Score',
                  'Autocross Score', 'Endurance Score', 'Efficiency Score']
 
 # Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
+compdata = load_results()
 comp_years = compdata['Year'].unique()
 
-# Data Cleaning
-processed_data = compdata[['Year', 'Team', 'Place', 'Total Score'] + SCORED_EVENTS]
-processed_data.loc[:,processed_data.columns != 'Team'] = processed_data.loc[:,processed_data.columns != 'Team'].apply(pd.to_numeric, errors='coerce')
-processed_data = processed_data.fillna(0)
-processed_data.sort_values(by='Year', ascending=False)
+source = ColumnDataSource(data=dict())
+
+# Initialize the plot with one stacked bar segment per event, all drawn from
+# the same source so a team change only replaces the source data
+plot = styled_figure({'x_label': "Year", 'y_label': "Total Score",
+                      'width': 1000, 'height': 625})
+
+for event, event_color in zip(SCORED_EVENTS, Spectral9):
+    segment = plot.rect(x='Year', y=stack_column(event, 'y'), width=0.8,
+                        height=stack_column(event, 'height'), source=source,
+                        color=event_color, legend=event)
+    plot.add_tools(HoverTool(renderers=[segment],
+                             tooltips=[("Year", '@Year'),
+                                       ("Selection", event),
+                                       ("Event Score", '@' + stack_column(event, 'score')),
+                                       ("Total Score", '@Total_Score'),
+                                       ("Overall Place", '@Place')]))
 
+plot.xaxis.ticker = FixedTicker(ticks=comp_years.astype(float))
+
+plot.legend.location = 'top_left'
 
 # Dropdown and interactive UI elements
-selectable_teams = list(processed_data['Team'].unique())
-selectable_teams.sort()
-rand = random.randint(0, len(selectable_teams))
-select_team = Select(title="Team", value=selectable_teams[rand], options=selectable_teams)
+selectable_teams = sorted(team_ids())
+initial_team = random.choice(selectable_teams)
+select_team = Select(title="Team", value=initial_team, options=selectable_teams)
 
+@timed('callback')
 def on_team_change(attrname, old, new):
     # Set the value of the select widget forcefully to prevent race condition
     select_team.value = new
     update(new)
 
 def update(team):
-    global layout
-    layout.children[0] = generate_chart(team) 
+    data = generate_data(team)
 
+    stacked = stacked_bars(data, SCORED_EVENTS)
+    stacked['Year'] = data['Year'].tolist()
+    stacked['Place'] = data['Place'].astype(int).tolist()
+    stacked['Total_Score'] = data['Total Score'].round(2).tolist()
+    for event in SCORED_EVENTS:
+        stacked[stack_column(event, 'score')] = data[event].tolist()
 
-def generate_data(team):
-    # Clean data
-    selected_data = processed_data.loc[processed_data['Team'] == team]
-    selected_data = selected_data.drop('Team', axis=1)
-    selected_data = selected_data.set_index('Year')
+    source.data = stacked
+    plot.title = "Formula SAE Michigan - " + team
 
-    # Add zeros for missing years
-    for year in comp_years:
-        if year not in selected_data.index.unique():
-            selected_data.loc[year] = 0
 
-    selected_data = selected_data.sort_index(ascending=True)
-    selected_data['Year'] = selected_data.index
-
-    return selected_data
+@timed('get_data')
+@memoize()
+def generate_data(team):
+    # Only the selected team's rows are copied, the shared index does the
+    # lookup. The IDs are looked up afresh, this session's may be outdated.
+    selected_data = rows_for('Team ID', team_ids().get(team, NO_TEAM))
+    selected_data = selected_data[['Year', 'Place', 'Total Score'] + SCORED_EVENTS].fillna(0)
+    return selected_data.sort_values(by='Year')
 
 
-def generate_chart(team):
-    data = generate_data(team)
-    selectable_years = list(map(str, data.index.unique()))
-
-    # Generate the chart UNFORTUNATELY using the high level plots. Streaming
-    # a bunch of quads resulted in lots of graphics corruption when switching
-    # teams. I would rather have the plots work all the time but really slow
-    # then have the plot show the wrong information.
-    barchart = Bar(data,
-                   values=blend(*SCORED_EVENTS, labels_name='event'),
-                   label=cat(columns='Year', sort=False),
-                   stack=cat(columns='event', sort=False),
-                   color=color(columns='event', palette=Spectral9, sort=False),
-                   xgrid=False, ygrid=False,
-                   plot_width=1000, plot_height=625,
-                   tools="pan,wheel_zoom,box_zoom,reset,resize")
-
-    barchart.title = "Formula SAE Michigan - " + team
-
-    barchart._xaxis.axis_label = "Teams"
-    barchart._xaxis.axis_line_color = None
-    barchart._xaxis.major_tick_line_color = None
-    barchart._xaxis.minor_tick_line_color = None
-
-    barchart._yaxis.axis_label = "Total Score"
-    barchart._yaxis.axis_line_color = None
-    barchart._yaxis.major_tick_line_color = None
-    barchart._yaxis.minor_tick_line_color = None
-
-    barchart.outline_line_color = None
-
-    barchart.toolbar_location = 'right'
-
-    barchart.logo = None
-
-    # Hacky tooltips
-    for renderer in barchart.select(GlyphRenderer):
-        if renderer.data_source.data['height'] != [0]:
-            year = renderer.data_source.data['Year']
-            place = data['Place'].loc[data['Year'] == year]
-            score = data['Total Score'].loc[data['Year'] == year]
-            hover = HoverTool(renderers=[renderer],
-                              tooltips=[("Year", '@Year'),
-                                        ("Selection", '@event'),
-                                        ("Event Score", '@height'),
-                                        ("Total Score", '%.2f' % score.values[0]),
-                                        ("Overall Place", '%d' % place.values[0])])
-            barchart.add_tools(hover)
-
-    return barchart
-
-
-# init sources
 select_team.on_change('value', on_team_change)
 
-layout = VBox(children=[generate_chart(selectable_teams[rand]), select_team])
+# Let go of the cached teams once no session shows this dashboard
+on_session_destroyed(curdoc(), generate_data.cache_release)
+
+layout = VBox(children=[plot, select_team])
+
+update(initial_team)
 
 curdoc().add_root(layout)
@@ -1,88 +1,87 @@
 #!/usr/bin/env python3
 
-from bokeh.charts import Bar
-from bokeh.charts.attributes import cat, color
-from bokeh.charts.operations import blend
 from bokeh.io import curdoc
+from bokeh.models import ColumnDataSource
+from bokeh.models.ranges import FactorRange
 from bokeh.models.widgets import Select, HBox
 from bokeh.palettes import Spectral9
 
-from functools import lru_cache
+import math
 
-import pandas as pd
+from fsaem.cache import memoize
+from fsaem.charts import stack_column, stacked_bars, styled_figure
+from fsaem.data import load_results
+from fsaem.index import rows_for
+from fsaem.metrics import timed
+from fsaem.sessions import on_session_destroyed
 
 SCORED_EVENTS = ['Penalty', 'Cost Score', 'Presentation Score',
                  'Design Score', 'Acceleration Score', 'Skid Pad Score',
                  'Autocross Score', 'Endurance Score', 'Efficiency Score']
 
 # Read in the FSAEM data
-compdata = pd.read_excel('FSAEM_summarized_results.xlsx')
+compdata = load_results()
+source = ColumnDataSource(data=dict())
+
+
+# Initialize the plot with one stacked bar segment per event, all drawn from
+# the same source so a year change only replaces the source data
+plot = styled_figure({'x_label': "Teams", 'y_label': "Total Score",
+                      'x_range': FactorRange(factors=[]),
+                      'width': 1000, 'height': 625})
+
+for event, event_color in zip(SCORED_EVENTS, Spectral9):
+    plot.rect(x='Team', y=stack_column(event, 'y'), width=0.8,
+              height=stack_column(event, 'height'), source=source,
+              color=event_color, legend=event)
+
+plot.xaxis.major_label_text_font_size = '0.6em'
+plot.xaxis.major_label_orientation = math.pi / 2
+
+plot.legend.location = 'top_right'
 
 # Dropdown and interactive UI elements
 selectable_years = list(map(str, compdata['Year'].unique()))
 select_year = Select(title="Year", value=selectable_years[-1], options=selectable_years)
 
 
+@timed('callback')
 def on_year_change(attrname, old, new):
     # Set the value of the select widget forcefully to prevent race condition
     select_year.value = new
     update(int(new))
 
 def update(year):
-    global layout
-    layout.children[1] = generate_chart(year) 
-
-@lru_cache()
-def get_data(year):
-    selected_data = compdata.loc[compdata['Year'] == year]
-
-    # This will raise a warning about sliced data assignment. The assignment in the
-    # line below works as desired. Based on the pandas documentation, the warning can be
-    # safely ignored.
-    selected_data[SCORED_EVENTS+['Total Score']] = selected_data[SCORED_EVENTS+['Total Score']].apply(pd.to_numeric, errors='coerce')
-    selected_data = selected_data.fillna(0)
-    selected_data = selected_data.sort_values(by='Total Score', ascending=False)
-
-    return selected_data
-
-
-def generate_chart(year):
     data = get_data(year)
+    teams = data['Team'].tolist()
 
-    barchart = Bar(data,
-                   values=blend(*SCORED_EVENTS, labels_name='event'),
-                   label=cat(columns='Team', sort=False),
-                   stack=cat(columns='event', sort=False),
-                   color=color(columns='event', palette=Spectral9, sort=False),
-                   xgrid=False, ygrid=False, legend='top_right',
-                   plot_width=1000, plot_height=625,
-                   tools="pan,wheel_zoom,box_zoom,reset,resize")
-
-    barchart.title = "Formula SAE Michigan " + str(year) + " Total Scores by Place"
-
-    barchart._xaxis.axis_label = "Teams"
-    barchart._xaxis.axis_line_color = None
-    barchart._xaxis.major_tick_line_color = None
-    barchart._xaxis.minor_tick_line_color = None
-    barchart._xaxis.major_label_text_font_size = '0.6em'
-
-    barchart._yaxis.axis_label = "Total Score"
-    barchart._yaxis.axis_line_color = None
-    barchart._yaxis.major_tick_line_color = None
-    barchart._yaxis.minor_tick_line_color = None
-
-    barchart.outline_line_color = None
+    # Stack the positive event scores up from zero and the penalties down
+    stacked = stacked_bars(data, SCORED_EVENTS)
+    stacked['Team'] = teams
 
-    barchart.toolbar_location = 'right'
+    plot.x_range.factors = teams
+    source.data = stacked
+    plot.title = "Formula SAE Michigan " + str(year) + " Total Scores by Place"
 
-    barchart.logo = None
+@timed('get_data')
+@memoize()
+def get_data(year):
+    selected_data = rows_for('Year', year)
+    selected_data = selected_data.fillna({column: 0 for column in SCORED_EVENTS + ['Total Score']})
+    selected_data['Team'] = selected_data['Team'].astype(str)
+    selected_data = selected_data.sort_values(by='Total Score', ascending=False)
 
-    return barchart
+    return selected_data
 
 
 select_year.on_change('value', on_year_change)
 
+# Let go of the cached years once no session shows this dashboard
+on_session_destroyed(curdoc(), get_data.cache_release)
+
 # Bokeh plotting output
-layout = HBox(children=[select_year, generate_chart(int(selectable_years[-1]))])
+layout = HBox(children=[select_year, plot])
+
+update(int(selectable_years[-1]))
 
 curdoc().add_root(layout)
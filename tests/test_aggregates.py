@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from fsaem.aggregates import NUMERIC_COLUMNS, STATISTICS, dnf_counts, year_statistics, year_value_counts
+from fsaem.data import load_results
+
+EVENTS = ['Endurance Adjusted Time', 'AutoX Best Time', 'Skid Pad Best Time', 'Accel Best Time']
+
+
+def test_year_statistics_match_describe():
+    compdata = load_results()
+    statistics = year_statistics()
+    assert statistics.index.tolist() == sorted(compdata['Year'].unique())
+
+    for year in statistics.index:
+        year_data = compdata.loc[compdata['Year'] == year]
+        for column in NUMERIC_COLUMNS:
+            described = year_data[column].describe()
+            expected = [described[name] if name != 'nulls' else year_data[column].isnull().sum()
+                        for name in STATISTICS]
+            np.testing.assert_allclose(statistics.loc[year, column].values.astype(float),
+                                       np.array(expected, dtype=float), err_msg='%s %d' % (column, year))
+
+
+def test_year_value_counts():
+    compdata = load_results()
+    counts = year_value_counts('Country')
+    for year in counts.index:
+        expected = compdata.loc[compdata['Year'] == year, 'Country'].value_counts()
+        assert counts.loc[year].sort_index().tolist() == expected.sort_index().tolist()
+
+
+def test_dnf_counts_match_the_per_year_loop():
+    compdata = load_results()
+    table = dnf_counts(EVENTS)
+
+    # The forfeits dashboard's original computation
+    selected_data = compdata.dropna(subset=['Place'])
+    years = selected_data['Year'].unique()
+    for event in EVENTS:
+        number_of_dnfs = np.empty(len(years))
+        number_of_entries = np.empty(len(years))
+        for index, year in enumerate(years):
+            year_data = selected_data.loc[selected_data['Year'] == year]
+            number_of_dnfs[index] = year_data[event].isnull().sum()
+            number_of_entries[index] = year_data[event].isnull().count()
+
+        expected = pd.DataFrame({'dnfs': number_of_dnfs,
+                                 'entries': number_of_entries,
+                                 'percentage_dnf': number_of_dnfs / number_of_entries},
+                                index=pd.Index(years, name='Year')).sort_index()
+        pd.testing.assert_frame_equal(table[event], expected, check_names=False)
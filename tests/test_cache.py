@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from fsaem import cache
+from fsaem.cache import memoize
+
+
+@pytest.fixture
+def frames(monkeypatch):
+    # The frame load_results returns; appending one stands in for an ingest
+    frames = [pd.DataFrame({'Year': [2014, 2015]})]
+    monkeypatch.setattr(cache, 'load_results', lambda: frames[-1])
+    monkeypatch.setattr(cache, '_caches', {})
+    return frames
+
+
+def session(calls):
+    # Like a dashboard script, every session defines its own get_data
+    @memoize(maxsize=2)
+    def get_data(year):
+        calls.append(year)
+        frame = cache.load_results()
+        return frame.loc[frame['Year'] == year]
+
+    return get_data
+
+
+def test_hits_and_lru(frames):
+    calls = []
+    get_data = session(calls)
+    get_data(2014)
+    get_data(2014)
+    assert calls == [2014]
+    assert get_data.cache_info() == cache.CacheInfo(1, 1, 2, 1)
+
+    get_data(2015)
+    get_data(2016)
+    get_data(2014)
+    assert calls == [2014, 2015, 2016, 2014]
+
+
+def test_results_are_private_copies(frames):
+    get_data = session([])
+    result = get_data(2014)
+    result['Year'] = 0
+    assert get_data(2014)['Year'].tolist() == [2014]
+
+
+def test_new_frame_invalidates(frames):
+    calls = []
+    get_data = session(calls)
+    get_data(2015)
+    frames.append(pd.DataFrame({'Year': [2015, 2015]}))
+    assert len(get_data(2015)) == 2
+    assert calls == [2015, 2015]
+
+
+def test_sessions_share_the_current_data(frames):
+    calls = []
+    old_session = session(calls)
+    assert len(old_session(2015)) == 1
+
+    # The data changes while the old session is open; whichever session
+    # computes the result first, every session gets the new data
+    frames.append(pd.DataFrame({'Year': [2015, 2015]}))
+    new_session = session(calls)
+    assert len(old_session(2015)) == 2
+    assert len(new_session(2015)) == 2
+    assert calls == [2015, 2015]
+
+
+def test_release_empties_with_the_last_session(frames):
+    first, second = session([]), session([])
+    first(2014)
+    first.cache_release()
+    assert second.cache_info().currsize == 1
+    second.cache_release()
+    assert second.cache_info().currsize == 0
@@ -0,0 +1,37 @@
+import numpy as np
+
+from fsaem.data import load_results
+from fsaem.histograms import ALL_YEARS, METRICS, bin_edges, histogram
+
+
+def metric_values(frame, metric):
+    options = METRICS[metric]
+    columns = [metric] + ([options['require']] if 'require' in options else [])
+    selected = frame[columns].dropna()
+    if options.get('exclude_zero'):
+        selected = selected.loc[selected[metric] != 0]
+    return selected[metric].values
+
+
+def test_counts_match_np_histogram():
+    compdata = load_results()
+    for metric, options in METRICS.items():
+        edges = bin_edges(metric_values(compdata, metric), options.get('max_value'))
+
+        for year in [ALL_YEARS] + sorted(compdata['Year'].unique().tolist()):
+            data = histogram(metric, year)
+            year_data = compdata if year == ALL_YEARS else compdata.loc[compdata['Year'] == year]
+            values = metric_values(year_data, metric)
+            if len(values) == 0:
+                # Years without results have an empty histogram
+                assert data['hist'] == [], (metric, year)
+                continue
+            expected, _ = np.histogram(values, bins=edges)
+
+            np.testing.assert_allclose(data['left_edge'] + data['right_edge'][-1:], edges)
+            assert data['hist'] == expected.tolist(), (metric, year)
+            assert data['samples'] == [expected.sum()] * len(expected)
+
+
+def test_year_without_results_is_empty():
+    assert histogram('Total Score', 1900)['hist'] == []
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from fsaem.data import load_results
+from fsaem.index import group_offsets, index_keys, rows_for
+
+
+def assert_same_rows(rows, expected):
+    # Copies, so the store's memory mapped columns compare as plain arrays
+    pd.testing.assert_frame_equal(rows.copy(), expected.copy())
+
+
+def test_rows_for_matches_a_mask():
+    compdata = load_results()
+    assert index_keys('Year') == sorted(compdata['Year'].unique())
+    for year in index_keys('Year'):
+        assert_same_rows(rows_for('Year', year), compdata.loc[compdata['Year'] == year])
+
+    for team_id in index_keys('Team ID'):
+        assert_same_rows(rows_for('Team ID', team_id), compdata.loc[compdata['Team ID'] == team_id])
+
+
+def test_unknown_key_is_empty():
+    assert rows_for('Year', 1900).empty
+
+
+def test_group_offsets_of_categories():
+    frame = pd.DataFrame({'Team': pd.Categorical(['b', 'a', None, 'b', 'c']),
+                          'Place': np.arange(5.0)})
+    ordered, offsets = group_offsets(frame, 'Team')
+    assert offsets == {'a': (0, 1), 'b': (1, 3), 'c': (3, 4)}
+    # Rows keep their order within a key and missing keys are left out
+    assert ordered['Place'].tolist() == [1.0, 0.0, 3.0, 4.0]
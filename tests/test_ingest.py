@@ -0,0 +1,97 @@
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+
+import pandas as pd
+
+from fsaem.data import COLUMNS, REPO_DIR, RESULTS_FILE, ingest_dir, load_results
+from fsaem.ingest import ingest
+
+# Runs against a copy of the workbook, with the new year ingested after
+# every aggregate was built, then compares the extended aggregates with ones
+# rebuilt from scratch
+COMPARE_SCRIPT = '''
+import pandas as pd
+
+from fsaem import api, data
+from fsaem.aggregates import dnf_counts, year_statistics, year_value_counts
+from fsaem.index import index_keys, rows_for
+from fsaem.ingest import ingest
+
+EVENTS = ['Endurance Adjusted Time', 'AutoX Best Time']
+
+
+def aggregates():
+    return {'year_statistics': year_statistics(),
+            'year_value_counts': year_value_counts('Country'),
+            'dnf_counts': dnf_counts(EVENTS),
+            'years': index_keys('Year'),
+            'year_rows': rows_for('Year', 2016),
+            'team_rows': rows_for('Team ID', int(rows_for('Year', 2015)['Team ID'].iloc[0])),
+            'api': api.derived('api_responses', api.build_responses, api.extend_responses)}
+
+
+aggregates()
+ingest(%(new)r, data.RESULTS_FILE)
+extended = aggregates()
+assert data._last_append[1] is data.load_results(), "the new year wasn't appended"
+
+data._derived.clear()
+rebuilt = aggregates()
+
+for name, value in extended.items():
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        pd.testing.assert_frame_equal(pd.DataFrame(value).sort_index(), pd.DataFrame(rebuilt[name]).sort_index())
+    elif name == 'api':
+        assert sorted(value) == sorted(rebuilt[name])
+        for path in value:
+            assert value[path][2] == rebuilt[name][path][2], path
+    else:
+        assert value == rebuilt[name], name
+'''
+
+
+def test_extend_matches_rebuild(tmp_path):
+    workbook = str(tmp_path / ('results-%s.xlsx' % uuid.uuid4().hex))
+    shutil.copy(RESULTS_FILE, workbook)
+
+    new_year = load_results()
+    new_year = new_year.loc[new_year['Year'] == 2015, COLUMNS].copy()
+    new_year['Year'] = 2016
+    new = str(tmp_path / 'new.xlsx')
+    new_year.to_excel(new, index=False)
+
+    env = dict(os.environ, FSAEM_RESULTS_FILE=workbook, FSAEM_METRICS_FILE='')
+    try:
+        subprocess.check_call([sys.executable, '-c', COMPARE_SCRIPT % {'new': new}],
+                              cwd=REPO_DIR, env=env)
+    finally:
+        shutil.rmtree(ingest_dir(workbook), ignore_errors=True)
+
+
+def test_ingested_teams_follow_workbook_edits(tmp_path):
+    workbook = str(tmp_path / ('results-%s.xlsx' % uuid.uuid4().hex))
+    results = load_results()[COLUMNS]
+    results.to_excel(workbook, index=False)
+
+    new_year = results.loc[results['Year'] == 2015].copy()
+    new_year['Year'] = 2016
+    new = str(tmp_path / 'new.xlsx')
+    new_year.to_excel(new, index=False)
+
+    try:
+        ingest(new, workbook)
+
+        # A team new to the workbook shifts the IDs of the teams after it
+        added = results.loc[results['Year'] == 2014].iloc[:1].copy()
+        added['Team'] = 'Aalto University'
+        pd.concat([results, added], ignore_index=True).to_excel(workbook, index=False)
+
+        frame = load_results(workbook)
+        ids = frame.loc[frame['Year'] == 2015, ['Team', 'Team ID']].reset_index(drop=True)
+        ingested = frame.loc[frame['Year'] == 2016, ['Team', 'Team ID']].reset_index(drop=True)
+        pd.testing.assert_frame_equal(ingested, ids)
+    finally:
+        shutil.rmtree(ingest_dir(workbook), ignore_errors=True)
@@ -0,0 +1,59 @@
+from fsaem.data import load_results
+from fsaem.teams import TeamMatcher, add_team_ids, team_key
+
+
+def matcher(exclude=()):
+    frame = load_results()
+    return TeamMatcher((team_key(str(team)), int(team_id))
+                       for team, team_id in zip(frame['Team'], frame['Team ID'])
+                       if team not in exclude)
+
+
+def team_id(name):
+    frame = load_results()
+    return int(frame.loc[frame['Team'] == name, 'Team ID'].iloc[0])
+
+
+def test_accents_fold():
+    assert team_key('Université Laval') == team_key('Universite Laval')
+    assert matcher().match(team_key('Universite de Sherbrooké'))[0] == team_id('Universite de Sherbrooke')
+
+
+def test_abbreviations_expand():
+    assert team_key('Purdue University - West Lafayette') == team_key('Purdue Univ - W Lafayette')
+    match = matcher().match(team_key('Georgia Inst of Tech'))
+    assert match[0] == team_id('Georgia Institute of Technology')
+
+
+def test_misspelling_matches():
+    match = matcher().match(team_key('Univ of Michgan - Ann Arbor'))
+    assert match[0] == team_id('Univ of Michigan - Ann Arbor')
+    assert match[2] < 1
+
+
+def test_other_campus_is_a_new_team():
+    known = matcher()
+    assert known.match(team_key('Univ of Michigan - Flint')) is None
+    assert known.match(team_key('Univ of Michigan - Ann Arbour')) is not None
+    # Known campuses of one school stay apart
+    known = matcher(exclude=['Univ of Michigan - Dearborn'])
+    assert known.match(team_key('Univ of Michigan - Dearborn')) is None
+
+
+def test_real_teams_merge():
+    frame, matches = add_team_ids(load_results()[['Year', 'Team']])
+    frame['Team'] = frame['Team'].astype(str)
+    spellings = frame.groupby('Team ID')['Team'].agg(lambda teams: frozenset(teams))
+    merged = set(teams for teams in spellings if len(teams) > 1)
+
+    assert merged == {frozenset(['Ecole Polytechnique De Montreal', 'Polytechnique Montréal']),
+                      frozenset(['IUPUI', 'Indiana Univ Purdue Univ Indianapolis']),
+                      frozenset(['Universite Du Quebec a Trois-Rivieres',
+                                 'Universite Du Quebec a\xa0Trois-Rivieres']),
+                      frozenset(['Universite Du Quebec-Chicoutimi', 'Universite Du\xa0Quebec-Chicoutimi']),
+                      frozenset(['Universite Laval', 'Université Laval']),
+                      frozenset(['Leeds University', 'University of Leeds']),
+                      frozenset(['University of Southern California', 'University of Southern California '])}
+    assert matches == []
+    # No team enters twice in one year
+    assert frame.groupby(['Year', 'Team ID']).size().max() == 1
@@ -0,0 +1,31 @@
+import json
+from wsgiref.util import setup_testing_defaults
+
+import wsgi
+
+
+def get(path):
+    # Servers pass PATH_INFO as its UTF-8 bytes decoded as latin-1
+    environ = {'PATH_INFO': path.encode('utf-8').decode('latin-1')}
+    setup_testing_defaults(environ)
+    response = {}
+
+    def start_response(status, headers):
+        response['status'] = status
+
+    body = b''.join(wsgi.application(environ, start_response))
+    return response['status'], body
+
+
+def test_accented_team():
+    status, body = get('/api/teams/Université Laval')
+    assert status == '200 OK'
+    results = json.loads(body.decode('utf-8'))
+    assert set(result['Team'] for result in results) == {'Universite Laval', 'Université Laval'}
+
+
+def test_team_list_round_trips():
+    status, body = get('/api/teams')
+    for team in json.loads(body.decode('utf-8')):
+        if team != team.encode('ascii', 'ignore').decode('ascii'):
+            assert get('/api/teams/' + team)[0] == '200 OK'
@@ -0,0 +1,66 @@
+import re
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fsaem.data import COLUMNS, RESULTS_FILE, normalize
+from fsaem.xlsx import read_columns
+
+
+def assert_same_results(read, expected):
+    for name in COLUMNS:
+        if str(expected[name].dtype) == 'category':
+            assert read[name].astype(object).tolist() == expected[name].astype(object).tolist(), name
+        else:
+            np.testing.assert_array_equal(read[name].values, expected[name].values, err_msg=name)
+
+
+def test_matches_read_excel():
+    read = pd.DataFrame(read_columns(RESULTS_FILE, COLUMNS), columns=COLUMNS)
+    expected = normalize(pd.read_excel(RESULTS_FILE))
+    assert len(read) == len(expected)
+    assert_same_results(read, expected)
+
+
+def test_projection_and_where():
+    read = read_columns(RESULTS_FILE, ['Year', 'Engine Cylinders'],
+                        where={'Year': lambda year: year >= 2013})
+    expected = normalize(pd.read_excel(RESULTS_FILE))
+    expected = expected.loc[expected['Year'] >= 2013]
+    assert sorted(read) == ['Engine Cylinders', 'Year']
+    np.testing.assert_array_equal(read['Engine Cylinders'], expected['Engine Cylinders'].values)
+
+
+def test_cells_without_references(tmp_path):
+    frame = pd.DataFrame({'Year': [2015, 2016], 'Team': ['A', 'B'], 'Place': [1.0, 'DNF']})
+    written = str(tmp_path / 'written.xlsx')
+    frame.to_excel(written, index=False)
+
+    # The r attribute is optional, a cell without one follows the previous cell
+    stripped = str(tmp_path / 'stripped.xlsx')
+    with zipfile.ZipFile(written) as source, zipfile.ZipFile(stripped, 'w') as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename.startswith('xl/worksheets/'):
+                data = re.sub(rb'<c r="[A-Z]+\d+"', b'<c', data)
+            target.writestr(item, data)
+
+    read = read_columns(stripped, ['Year', 'Team', 'Place'])
+    assert read['Year'].tolist() == [2015, 2016]
+    assert read['Team'].astype(object).tolist() == ['A', 'B']
+    assert read['Place'][0] == 1.0 and np.isnan(read['Place'][1])
+
+
+def test_missing_integer_is_an_error(tmp_path):
+    frame = pd.DataFrame({'Year': [2015, None, 2016], 'Team': ['A', 'B', 'C']})
+    written = str(tmp_path / 'written.xlsx')
+    frame.to_excel(written, index=False)
+
+    # read_excel keeps the blank Year as NaN, an int64 column can't
+    with pytest.raises(ValueError, match='Row 3 .*Year'):
+        read_columns(written, ['Year', 'Team'])
+    with pytest.raises(ValueError, match='Row 3 .*Year'):
+        read_columns(written, ['Team'], where={'Year': lambda year: year >= 2016})
+    assert read_columns(written, ['Year'], dtypes={'Year': 'float64'})['Year'].tolist()[0] == 2015